@@ -0,0 +1,87 @@
+"""Liggeranalyse zonder UI: importeert alleen NumPy en de rekenkern
+
+Fouten komen als typed exceptions (errors.py); de Streamlit-app vangt
+ze af en toont ze als melding.
+"""
+from beam_solver import BeamSolver, adaptive_grid, deflection, internal_forces, support_reactions, validate_loads
+from errors import LoadError, SectionError, SupportError
+from extrema import beam_extremes, sampled_extremes
+from profiles import moment_of_inertia
+from result_cache import analysis_cache, model_hash
+
+RESULT_KEYS = ('x', 'V', 'M', 'theta', 'y', 'reactions')
+
+def analyze_beam(beam_length, supports, loads, profile_type, height, width, wall_thickness,
+                 flange_thickness, E, store=None):
+    """Analyseer de balk; ongewijzigde invoer komt direct uit de resultaatcache
+
+    Geeft (x, V, M, theta, y, reactions). Met een ResultStore wordt bij
+    een cache-misser eerst op schijf gezocht en daarna opgeslagen.
+    """
+    key = model_hash(
+        beam_length, supports, loads,
+        profile_type=profile_type, height=height, width=width,
+        wall_thickness=wall_thickness, flange_thickness=flange_thickness, E=E
+    )
+    results = analysis_cache.get(key)
+    if results is not None:
+        return results
+
+    # Daarna de persistente store (gedeeld tussen herstarts en processen)
+    if store is not None:
+        stored = store.get(key)
+        if stored is not None:
+            return analysis_cache.put(key, tuple(stored[k] for k in RESULT_KEYS))
+
+    results = _analyze_beam(beam_length, supports, loads, profile_type, height, width,
+                            wall_thickness, flange_thickness, E)
+    if store is not None:
+        store.put(key, dict(zip(RESULT_KEYS, results)))
+    return analysis_cache.put(key, results)
+
+def result_extremes(beam_length, supports, loads, EI, x, V, M, theta, y):
+    """Extrema van V, M, theta en y: exact tussen de roosterpunten
+
+    Valt terug op de bemonsterde arrays als BeamSolver de invoer niet
+    accepteert (bijv. steunpunten buiten de balk). Geeft per grootheid
+    (waarde, x) zoals beam_extremes.
+    """
+    try:
+        return beam_extremes(BeamSolver(beam_length, supports, loads, EI).solve_piecewise())
+    except ValueError:
+        return sampled_extremes(x, V=V, M=M, theta=theta, y=y)
+
+def _analyze_beam(beam_length, supports, loads, profile_type, height, width, wall_thickness, flange_thickness, E):
+    """Analyseer de balk met verbeterde mechanica"""
+    I = moment_of_inertia(profile_type, height, width, wall_thickness, flange_thickness)
+    if I <= 0:
+        raise SectionError("Ongeldige profielafmetingen")
+
+    # Bereken buigstijfheid EI
+    EI = E * I
+
+    if not supports:
+        raise SupportError("Geen steunpunten opgegeven")
+    if not loads:
+        raise LoadError("Geen belastingen opgegeven")
+    validate_loads(loads)
+
+    # Sorteer steunpunten op positie voor consistente berekening
+    sorted_supports = sorted(supports, key=lambda s: s[0])
+
+    # Berekeningsrooster alleen extenden als er daadwerkelijk overhang is
+    min_support_pos = sorted_supports[0][0]
+    max_support_pos = sorted_supports[-1][0]
+    x_start = 0
+    x_end = beam_length
+    if min_support_pos < 0 or max_support_pos > beam_length:
+        x_start = min(0, min_support_pos - 0.05*beam_length)
+        x_end = max(beam_length, max_support_pos + 0.05*beam_length)
+
+    # Lastbewust rooster: knopen exact op steunpunten en lastranden
+    x = adaptive_grid(beam_length, sorted_supports, loads, 200, x_start, x_end)
+    reactions = support_reactions(sorted_supports, loads)
+    V, M = internal_forces(x, reactions, loads)
+    theta, y = deflection(x, sorted_supports, reactions, loads, M, EI, V)
+
+    return x, V, M, theta, y, reactions
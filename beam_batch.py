@@ -0,0 +1,242 @@
+"""Headless batchberekening van liggers uit JSON/JSON Lines/CSV/YAML
+
+Gebruik:
+    python beam_batch.py liggers.jsonl -o resultaten.jsonl
+    python beam_batch.py liggers.csv -o resultaten.csv --progress 1000
+
+Elke ligger is een object met:
+    id        naam (optioneel)
+    length    balklengte (mm)
+    supports  [[positie, type], ...]
+    loads     [[positie, waarde, type, (lengte), (eindwaarde)], ...]
+    EI        buigstijfheid (N·mm²), of E (N/mm²) met I (mm⁴) of profile ("HEA 200")
+
+CSV heeft kolommen id, length, EI/E/I/profile, supports en loads, met
+supports als "0:Scharnier;6000:Rol" en loads als
+"1000:5000:Puntlast;0:10:Verdeelde last:6000".
+
+Invoer en uitvoer worden gestreamd: er staat steeds maar één ligger in
+het geheugen. Importeert geen Streamlit, Plotly of ReportLab.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+
+import numpy as np
+
+from beam_solver import BeamSolver
+from extrema import beam_extremes
+from profiles import section_catalogue
+
+ARRAY_KEYS = ('x', 'V', 'M', 'theta', 'y')
+SUMMARY_FIELDS = ['id', 'max_V', 'x_V', 'max_M', 'x_M', 'max_theta', 'x_theta', 'max_y', 'x_y', 'reactions', 'error']
+
+def read_beams(path, fmt=None):
+    """Generator over liggerdefinities; formaat uit de extensie of fmt"""
+    fmt = fmt or _format_from_path(path)
+    stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if fmt == "jsonl":
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+        elif fmt == "json":
+            yield from _iter_json(stream)
+        elif fmt == "csv":
+            for row in csv.DictReader(stream):
+                yield _beam_from_csv(row)
+        elif fmt == "yaml":
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError("YAML-invoer vereist PyYAML (pip install pyyaml)")
+            for doc in yaml.safe_load_all(stream):
+                if isinstance(doc, list):
+                    yield from doc
+                elif doc is not None:
+                    yield doc
+        else:
+            raise ValueError(f"Onbekend invoerformaat: {fmt}")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def _format_from_path(path):
+    ext = path.rsplit(".", 1)[-1].lower() if "." in path else "jsonl"
+    return {"ndjson": "jsonl", "yml": "yaml", "txt": "jsonl"}.get(ext, ext)
+
+def _iter_json(stream, chunk_size=1 << 16):
+    """Stapsgewijs lezen van een JSON-array (of één object) zonder alles te laden"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    in_array = None
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if in_array is None and buffer:
+            in_array = buffer[0] == "["
+            if in_array:
+                buffer = buffer[1:]
+            continue
+        if in_array:
+            buffer = buffer.lstrip(", \t\r\n")
+            if buffer.startswith("]"):
+                return
+        if buffer:
+            try:
+                obj, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # Een getal aan het eind van de buffer kan nog doorlopen
+                if end < len(buffer) or eof or not in_array:
+                    yield obj
+                    buffer = buffer[end:]
+                    if not in_array:
+                        return
+                    continue
+        if eof:
+            return
+        chunk = stream.read(chunk_size)
+        eof = chunk == ""
+        buffer += chunk
+
+def _beam_from_csv(row):
+    beam = {k: v for k, v in row.items() if v not in (None, "")}
+    beam['supports'] = [_parse_item(s) for s in beam.get('supports', "").split(";") if s.strip()]
+    beam['loads'] = [_parse_item(s) for s in beam.get('loads', "").split(";") if s.strip()]
+    for key in ('length', 'EI', 'E', 'I', 'n_points'):
+        if key in beam:
+            beam[key] = float(beam[key])
+    return beam
+
+def _parse_item(text):
+    """'1000:5000:Puntlast' -> [1000.0, 5000.0, 'Puntlast']"""
+    parts = []
+    for part in text.split(":"):
+        part = part.strip()
+        try:
+            parts.append(float(part))
+        except ValueError:
+            parts.append(part)
+    return parts
+
+def beam_stiffness(beam):
+    """EI uit de definitie: EI direct, of E maal I of maal het profiel"""
+    if 'EI' in beam:
+        return float(beam['EI'])
+    E = float(beam.get('E', 210000.0))
+    if 'I' in beam:
+        return E * float(beam['I'])
+    if 'profile' in beam:
+        catalogue = section_catalogue()
+        return E * catalogue.I[catalogue.index(beam['profile'])]
+    raise ValueError("Geef EI, E met I, of een profiel op")
+
+def solve_beam(beam, arrays=False):
+    """Los één ligger op; geeft een samenvatting (exacte extrema) als dict"""
+    supports = [(float(p), str(t)) for p, t in beam['supports']]
+    loads = [(float(p), float(v), str(t), *map(float, rest)) for p, v, t, *rest in beam['loads']]
+    length = float(beam['length'])
+    # Zonder arrays is geen rekenrooster nodig: de extrema zijn exact
+    x = None if arrays else np.array([0.0, length])
+    solver = BeamSolver(length, supports, loads, beam_stiffness(beam), x=x,
+                        n_points=int(beam.get('n_points', 200)))
+    exact = solver.solve_piecewise()
+
+    summary = {'id': beam.get('id')}
+    for key, (value, at) in beam_extremes(exact).items():
+        summary[f'max_{key}'] = float(value)
+        summary[f'x_{key}'] = float(at)
+    summary['reactions'] = {str(k): float(v) for k, v in exact['reactions'].items()}
+    if arrays:
+        results = solver.solve()
+        for key in ARRAY_KEYS:
+            summary[key] = results[key]
+    return summary
+
+def solve_beam_safe(beam, arrays=False):
+    """solve_beam, maar een fout komt als 'error' in het resultaat"""
+    try:
+        return solve_beam(beam, arrays)
+    except (ValueError, KeyError, TypeError, AttributeError, np.linalg.LinAlgError) as e:
+        return {'id': beam.get('id') if isinstance(beam, dict) else None, 'error': str(e)}
+
+def run_batch(beams, write, arrays=False, progress=None, log=sys.stderr, workers=None):
+    """Los een stroom liggers op en geef elk resultaat direct door aan write
+
+    Fouten per ligger komen in het resultaat ('error') en stoppen de batch
+    niet. Met workers > 1 wordt over processen verdeeld (parallel.py).
+    Geeft (aantal, aantal fouten, duur in s).
+    """
+    if workers and workers > 1:
+        from parallel import solve_beams_parallel
+        results = solve_beams_parallel(beams, workers=workers, arrays=arrays)
+    else:
+        results = (solve_beam_safe(beam, arrays) for beam in beams)
+
+    start = last = time.perf_counter()
+    count = failed = 0
+    for result in results:
+        failed += 'error' in result
+        write(result)
+        count += 1
+
+        now = time.perf_counter()
+        if progress and (count % progress == 0 or now - last > 5.0):
+            print(f"{count} liggers, {count / (now - start):.0f} liggers/s", file=log, flush=True)
+            last = now
+    return count, failed, time.perf_counter() - start
+
+def _writer(stream, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+        def write(result):
+            row = dict(result)
+            if 'reactions' in row:
+                row['reactions'] = json.dumps(row['reactions'])
+            writer.writerow(row)
+        return write
+
+    def write(result):
+        stream.write(json.dumps(result, default=_to_json) + "\n")
+    return write
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Niet serialiseerbaar: {type(value)}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batchberekening van liggers zonder webinterface")
+    parser.add_argument("input", help="invoerbestand (.json, .jsonl, .csv, .yaml) of - voor stdin")
+    parser.add_argument("-o", "--output", default="-", help="uitvoer (.jsonl of .csv), standaard stdout")
+    parser.add_argument("--format", choices=["json", "jsonl", "csv", "yaml"], help="invoerformaat forceren")
+    parser.add_argument("--arrays", action="store_true", help="ook x, V, M, theta en y wegschrijven")
+    parser.add_argument("--progress", type=int, default=1000, help="voortgang elke N liggers (0 = uit)")
+    parser.add_argument("--workers", type=int, default=1, help="aantal processen (standaard 1)")
+    args = parser.parse_args(argv)
+
+    out_fmt = "csv" if args.output.lower().endswith(".csv") else "jsonl"
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        count, failed, duration = run_batch(
+            read_beams(args.input, args.format), _writer(out, out_fmt), args.arrays, args.progress,
+            workers=args.workers
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    rate = count / duration if duration > 0 else 0.0
+    print(f"Klaar: {count} liggers in {duration:.1f} s ({rate:.0f} liggers/s), {failed} fouten",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Scenegraaf van de balkvisualisatie: Plotly-elementen per steunpunt en last
+
+Elk steunpunt en elke last wordt los vertaald naar traces, shapes en
+annotaties (gewone dicts, geen Plotly-objecten). Die vertaling is
+gecachet per element en symboolgrootte, zodat bij een rerun alleen
+gewijzigde elementen opnieuw worden opgebouwd; plot_interactive_beam
+zet de stukken daarna in één keer in een figuur. Importeert geen Plotly.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from beam_solver import distributed_profile
+
+COLORS = {
+    'beam': '#2c3e50',
+    'support': '#3498db',
+    'support_fill': '#3498db',
+    'load': '#e74c3c',
+    'moment': '#9b59b6',
+    'dimension': '#7f8c8d',
+    'text': '#2c3e50',
+    'grid': '#ecf0f1'
+}
+
+def load_intensity_label(q1, q2):
+    """Tekst voor een verdeelde last: één waarde of begin- en eindwaarde"""
+    if q1 == q2:
+        return f"{abs(q1)/1000:.1f} kN/m"
+    return f"{abs(q1)/1000:.1f}–{abs(q2)/1000:.1f} kN/m"
+
+def scene_extent(beam_length, supports):
+    """(min_x, max_x, beam_height) in mm, inclusief overhang en 5% marge"""
+    positions = [s[0] for s in supports]
+    min_x = min(0, min(positions)) if positions else 0
+    max_x = max(beam_length, max(positions)) if positions else beam_length
+    span = max_x - min_x
+    return min_x - 0.05 * span, max_x + 0.05 * span, 0.2 * span
+
+def beam_scene(beam_length, supports, loads):
+    """Alle elementen van de balkfiguur als {'traces', 'shapes', 'annotations', ...}"""
+    min_x, max_x, beam_height = scene_extent(beam_length, supports)
+    traces = [_line([min_x/1000, max_x/1000], [0, 0], COLORS['beam'], 8, name='Balk', showlegend=True)]
+    shapes, annotations = [], []
+
+    parts = [support_scene(float(pos), str(type), beam_height)
+             for pos, type in sorted(supports, key=lambda s: s[0])]
+    parts += [load_scene(_load_key(load), beam_height) for load in loads]
+    for part in parts:
+        traces.extend(part['traces'])
+        shapes.extend(part['shapes'])
+        annotations.extend(part['annotations'])
+
+    # Annotatie voor balklengte
+    annotations.append(dict(
+        x=(0 + beam_length/1000) / 2,
+        y=-2 * beam_height,
+        text=f"Balklengte: {beam_length} mm",
+        showarrow=False,
+        font=dict(size=14, color=COLORS['text'])
+    ))
+    return {
+        'traces': traces,
+        'shapes': shapes,
+        'annotations': annotations,
+        'x_range': [min_x/1000, max_x/1000],
+        'y_range': [-3 * beam_height, 3 * beam_height],
+    }
+
+def _load_key(load):
+    """Hashbare, genormaliseerde last voor de cache"""
+    pos, value, load_type, *rest = load
+    return (float(pos), float(value), str(load_type), *map(float, rest))
+
+def _line(x, y, color, width, name=None, showlegend=False, fill=None):
+    trace = dict(type='scatter', x=list(x), y=list(y), mode='lines',
+                 line=dict(color=color, width=width), showlegend=showlegend)
+    if name is not None:
+        trace['name'] = name
+    if fill is not None:
+        trace.update(fill='toself', fillcolor=fill)
+    return trace
+
+def _segments(pieces):
+    """Meerdere lijnstukken in één trace, gescheiden door None"""
+    x, y = [], []
+    for xs, ys in pieces:
+        if x:
+            x.append(None)
+            y.append(None)
+        x.extend(xs)
+        y.extend(ys)
+    return x, y
+
+@lru_cache(maxsize=512)
+def support_scene(pos, support_type, beam_height):
+    """Symbool van één steunpunt (gecachet per positie, type en schaal)"""
+    traces, shapes = [], []
+    x = pos/1000
+    kind = support_type.lower()
+
+    if kind in ("scharnier", "rol"):
+        # Driehoek; de rol is korter en heeft drie rolletjes
+        triangle_size = beam_height/2
+        depth = 0.7 if kind == "scharnier" else 0.5
+        shapes.append(dict(
+            type="path",
+            path=f"M {x-triangle_size/2000},{-beam_height*0.1} L {x+triangle_size/2000},{-beam_height*0.1} L {x},{-beam_height*depth} Z",
+            line=dict(color=COLORS['support'], width=3),
+            fillcolor=COLORS['support_fill'],
+            opacity=0.8
+        ))
+        if kind == "scharnier":
+            # Verticale lijn van balk naar scharnier en grondlijn onder de driehoek
+            base = ([x-triangle_size/1000, x+triangle_size/1000], [-beam_height*0.7, -beam_height*0.7])
+        else:
+            rol_radius = triangle_size/6000
+            for i in range(3):
+                x_offset = (i-1) * rol_radius * 4
+                shapes.append(dict(
+                    type="circle",
+                    x0=(x+x_offset)-rol_radius,
+                    y0=(-beam_height*0.7)-rol_radius,
+                    x1=(x+x_offset)+rol_radius,
+                    y1=(-beam_height*0.7)+rol_radius,
+                    line=dict(color=COLORS['support'], width=2),
+                    fillcolor=COLORS['support_fill']
+                ))
+            base = ([x-triangle_size/1200, x+triangle_size/1200], [-beam_height*0.85, -beam_height*0.85])
+        traces.append(_line(*_segments([([x, x], [0, -beam_height*0.1]), base]), COLORS['support'], 3))
+
+    elif kind == "inklemming":
+        # Inklemming als rechthoek met verticale strepen
+        rect_width = beam_height/3
+        rect_height = beam_height*1.4
+        shapes.append(dict(
+            type="rect",
+            x0=x - rect_width/2000,
+            y0=-rect_height/2,
+            x1=x + rect_width/2000,
+            y1=rect_height/2,
+            line=dict(color=COLORS['support'], width=3),
+            fillcolor='white',
+            opacity=1.0
+        ))
+        num_stripes = 7
+        stripe_width = rect_width / (num_stripes + 1)
+        for i in range(1, num_stripes + 1):
+            stripe_x = x - rect_width/2000 + i * stripe_width/1000
+            shapes.append(dict(
+                type="line",
+                x0=stripe_x,
+                y0=-rect_height/2,
+                x1=stripe_x,
+                y1=rect_height/2,
+                line=dict(color=COLORS['support'], width=2)
+            ))
+    return {'traces': tuple(traces), 'shapes': tuple(shapes), 'annotations': ()}
+
+@lru_cache(maxsize=512)
+def load_scene(load, beam_height):
+    """Pijlen, label en legenda-item van één last (gecachet per last en schaal)"""
+    pos, value, load_type = load[:3]
+    direction = -1 if value > 0 else 1  # Positief is naar beneden
+    traces, annotations = [], []
+    profile = distributed_profile(load)
+
+    if load_type.lower() == "puntlast":
+        arrow_length = 1.8 * beam_height
+        arrow_head_length = arrow_length * 0.2
+        x = pos/1000
+        # Pijlsteel en pijlpunt
+        traces.append(_line([x, x], [0, direction * (arrow_length - arrow_head_length)], COLORS['load'], 3))
+        traces.append(_line(
+            [x - arrow_head_length/2/1000, x, x + arrow_head_length/2/1000],
+            [direction * (arrow_length - arrow_head_length), direction * arrow_length,
+             direction * (arrow_length - arrow_head_length)],
+            COLORS['load'], 3, fill=COLORS['load']
+        ))
+        annotations.append(dict(
+            x=x,
+            y=direction * arrow_length + direction * beam_height*0.5,
+            text=f"{abs(value)/1000:.1f} kN",
+            showarrow=False,
+            font=dict(size=12, color=COLORS['load'])
+        ))
+        label, marker_x, marker_y = f'Puntlast {abs(value)/1000:.1f} kN op {pos:g} mm', x, direction * arrow_length/2
+
+    elif profile is not None:
+        _, length, q1, q2 = profile
+        start_pos = pos/1000
+        end_pos = (pos + length)/1000
+
+        # Hoogte van pijlen, evenredig met de lastintensiteit
+        arrow_height = 1.8 * beam_height
+        q_max = max(abs(q1), abs(q2)) or 1.0
+        h1, h2 = arrow_height * abs(q1) / q_max, arrow_height * abs(q2) / q_max
+        traces.append(_line([start_pos, end_pos], [direction * h1, direction * h2], COLORS['load'], 3))
+
+        # Alle pijlstelen in één trace, alle pijlpunten in één gevulde trace
+        num_arrows = max(3, min(10, int(length/300) + 2))
+        x_arrows = np.linspace(start_pos, end_pos, num_arrows)
+        heights = np.interp(x_arrows, [start_pos, end_pos], [h1, h2])
+        arrow_head_size = arrow_height * 0.12
+        stems = [([xa, xa], [direction * h, 0]) for xa, h in zip(x_arrows.tolist(), heights.tolist())]
+        heads = [([xa - arrow_head_size/2/1000, xa, xa + arrow_head_size/2/1000],
+                  [direction * arrow_head_size, 0, direction * arrow_head_size]) for xa in x_arrows.tolist()]
+        traces.append(_line(*_segments(stems), COLORS['load'], 2))
+        traces.append(_line(*_segments(heads), COLORS['load'], 2, fill=COLORS['load']))
+
+        annotations.append(dict(
+            x=(start_pos + end_pos)/2,
+            y=direction * arrow_height + direction * beam_height*0.5,
+            text=load_intensity_label(q1, q2),
+            showarrow=False,
+            font=dict(size=12, color=COLORS['load'])
+        ))
+        label = f'{load_type} {load_intensity_label(q1, q2)} op {pos:g}-{pos+length:g} mm'
+        marker_x, marker_y = (start_pos + end_pos)/2, direction * arrow_height/2
+    else:
+        return {'traces': (), 'shapes': (), 'annotations': ()}
+
+    # Legenda-item
+    traces.append(dict(type='scatter', x=[marker_x], y=[marker_y], mode='markers',
+                       marker=dict(size=0.1, color=COLORS['load']), name=label, showlegend=True))
+    return {'traces': tuple(traces), 'shapes': (), 'annotations': tuple(annotations)}
@@ -1,49 +1,798 @@
+import hashlib
+
 import numpy as np
 
+from errors import BeamError, LoadError, SingularSystemError, SupportError
+from piecewise import PiecewisePolynomial
+
+LOAD_TYPES = ("puntlast", "moment", "verdeelde last", "driehoekslast", "trapeziumlast")
+
 # Alternatief voor scipy functies
+def cumulative_integrate(y, x, initial=0, method="trapezoid", dydx=None, axis=-1,
+                         y_left=None, dydx_left=None):
+    """Gevectoriseerde cumulatieve integratie van y over x (via np.cumsum)
+
+    Methodes:
+    - "trapezoid": trapeziumregel, identiek aan de oude lus
+    - "simpson": per interval de parabool door drie opeenvolgende punten
+    - "exact": kubische Hermite-interpolatie met afgeleide dydx, exact voor
+      stuksgewijs kubische functies (bijv. theta uit M/EI met dydx = V/EI)
+
+    Werkt langs `axis`, zodat ook gestapelde belastinggevallen in één keer
+    geïntegreerd kunnen worden. Heeft y sprongen precies op knopen, geef
+    dan in y_left de linkerlimieten; elk interval gebruikt dan de waarde
+    net rechts van de beginknoop en net links van de eindknoop
+    (trapezoid en exact). Hetzelfde geldt voor dydx en dydx_left.
+    """
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, -1)
+    x = np.asarray(x, dtype=float)
+    h = np.diff(x)
+    y_end = y if y_left is None else np.moveaxis(np.asarray(y_left, dtype=float), axis, -1)
+
+    if method == "trapezoid":
+        parts = 0.5 * (y_end[..., 1:] + y[..., :-1]) * h
+    elif method == "simpson":
+        parts = _simpson_parts(y, h)
+    elif method == "exact":
+        if dydx is None:
+            raise ValueError("Methode 'exact' vereist de afgeleide dydx")
+        d = np.moveaxis(np.asarray(dydx, dtype=float), axis, -1)
+        d_end = d if dydx_left is None else np.moveaxis(np.asarray(dydx_left, dtype=float), axis, -1)
+        parts = (0.5 * (y_end[..., 1:] + y[..., :-1]) * h
+                 + h**2 / 12 * (d[..., :-1] - d_end[..., 1:]))
+    else:
+        raise ValueError(f"Onbekende integratiemethode: {method}")
+
+    # Beginwaarde vooraan zodat de optelvolgorde gelijk is aan de oude lus
+    start = np.broadcast_to(np.asarray(initial, dtype=float), y.shape[:-1] + (1,))
+    result = np.cumsum(np.concatenate([start, parts], axis=-1), axis=-1)
+    return np.moveaxis(result, -1, axis)
+
+def _simpson_parts(y, h):
+    """Integraal per interval van de parabool door drie naburige punten
+
+    Standaard door het interval en het volgende punt (vooruit); waar dat
+    niet kan (laatste interval, samenvallende knoop erna) door het vorige
+    punt (achteruit). Alleen als beide niet kunnen de trapeziumregel.
+    """
+    trap = 0.5 * (y[..., 1:] + y[..., :-1]) * h
+    if y.shape[-1] < 3:
+        return trap
+
+    # fwd[i]: parabool door i, i+1, i+2 over [x_i, x_i+1]
+    # bwd[i]: parabool door i, i+1, i+2 over [x_i+1, x_i+2]
+    h0, h1 = h[:-1], h[1:]
+    H = h0 + h1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fwd = h0/6 * (y[..., :-2] * (3*H - h0)/H
+                      + y[..., 1:-1] * (3*H - 2*h0)/h1
+                      - y[..., 2:] * h0**2/(H*h1))
+        bwd = h1/6 * (y[..., 2:] * (3*H - h1)/H
+                      + y[..., 1:-1] * (3*H - 2*h1)/h0
+                      - y[..., :-2] * h1**2/(H*h0))
+
+    # Terugvallen bij samenvallende knopen (h = 0)
+    ok = (h0 > 0) & (h1 > 0)
+    parts = trap.copy()
+    parts[..., 1:] = np.where(ok, bwd, parts[..., 1:])
+    parts[..., :-1] = np.where(ok, fwd, parts[..., :-1])
+    return parts
+
 def custom_cumtrapz(y, x, initial=0):
     """Eigen implementatie van cumtrapz"""
-    result = np.zeros_like(y)
-    result[0] = initial
-    for i in range(1, len(y)):
-        result[i] = result[i-1] + 0.5 * (y[i] + y[i-1]) * (x[i] - x[i-1])
-    return result
+    return cumulative_integrate(y, x, initial=initial)
 
 def custom_solve_banded(l_and_u, ab, b):
-    """Vereenvoudigde implementatie voor bandmatrix"""
-    # Converteer naar volledige matrix en gebruik numpy.linalg.solve
+    """Los een bandmatrix-stelsel op met banded LU (O(n), geen volle matrix)
+
+    Bandopslag: ab[l + j - i, i] = A[i, j] voor max(0, i-l) <= j <= i+u.
+    Zonder pivotering; bedoeld voor diagonaal dominante stelsels zoals de
+    drie-momentenvergelijking. b mag (n,) of (n, k) zijn.
+    """
+    l, u = l_and_u
+    if (l, u) == (1, 1):
+        return solve_tridiagonal(ab[0], ab[1], ab[2], b)
+
     n = len(b)
-    A = np.zeros((n, n))
-    
-    for i in range(n):
-        for j in range(max(0, i-l_and_u[0]), min(n, i+l_and_u[1]+1)):
-            A[i, j] = ab[l_and_u[0] + j - i, i]
-    
-    return np.linalg.solve(A, b)
+    W = np.array(ab, dtype=float).T.copy()  # W[i, l + j - i] = A[i, j]
+    x = np.array(b, dtype=float).copy()
+
+    # Voorwaartse eliminatie binnen de band
+    for k in range(n - 1):
+        pivot = W[k, l]
+        if pivot == 0:
+            raise SingularSystemError("Singuliere bandmatrix")
+        for i in range(k + 1, min(n, k + l + 1)):
+            f = W[i, l + k - i] / pivot
+            if f != 0:
+                W[i, l + k - i:l + k - i + u + 1] -= f * W[k, l:l + u + 1]
+                x[i] -= f * x[k]
+
+    # Terugsubstitutie
+    if W[n - 1, l] == 0:
+        raise SingularSystemError("Singuliere bandmatrix")
+    for k in range(n - 1, -1, -1):
+        m = min(u, n - 1 - k)
+        if m:
+            x[k] -= W[k, l + 1:l + m + 1] @ x[k + 1:k + m + 1]
+        x[k] /= W[k, l]
+    return x
+
+def solve_tridiagonal(lower, diag, upper, rhs):
+    """Thomas-algoritme voor tridiagonale stelsels, O(n)
+
+    lower[i] = A[i, i-1] (lower[0] genegeerd), diag[i] = A[i, i],
+    upper[i] = A[i, i+1] (upper[-1] genegeerd). rhs mag (n,) of (n, k) zijn.
+    """
+    n = len(diag)
+    c = np.zeros(n)
+    d = np.array(rhs, dtype=float).copy()
+    denom = diag[0]
+    if denom == 0:
+        raise SingularSystemError("Singuliere tridiagonale matrix")
+    c[0] = upper[0] / denom if n > 1 else 0.0
+    d[0] = d[0] / denom
+    for i in range(1, n):
+        denom = diag[i] - lower[i] * c[i-1]
+        if denom == 0:
+            raise SingularSystemError("Singuliere tridiagonale matrix")
+        if i < n - 1:
+            c[i] = upper[i] / denom
+        d[i] = (d[i] - lower[i] * d[i-1]) / denom
+    for i in range(n - 2, -1, -1):
+        d[i] -= c[i] * d[i+1]
+    return d
+
+def validate_loads(loads):
+    """LoadError bij een onbekend lasttype of een onvolledige lastdefinitie"""
+    for load in loads:
+        ltype = str(load[2]).lower() if len(load) >= 3 else None
+        if ltype not in LOAD_TYPES:
+            raise LoadError(f"Onbekend lasttype: {ltype}")
+        needed = {"verdeelde last": 4, "driehoekslast": 4, "trapeziumlast": 5}.get(ltype, 3)
+        if len(load) < needed:
+            raise LoadError(f"Onvolledige {load[2]}: {load}")
+
+def distributed_profile(load):
+    """(begin, lengte, q_begin, q_eind) van een verdeelde last, anders None
+
+    "Verdeelde last" (p, q, type, lengte) is constant, "Driehoekslast"
+    (p, q, type, lengte) loopt lineair van 0 bij p naar q aan het eind en
+    "Trapeziumlast" (p, q, type, lengte, q_eind) van q naar q_eind.
+    """
+    p, val, ltype, *rest = load
+    ltype = ltype.lower()
+    if ltype == "verdeelde last":
+        return p, rest[0], val, val
+    if ltype == "driehoekslast":
+        return p, rest[0], 0.0, val
+    if ltype == "trapeziumlast":
+        return p, rest[0], val, rest[1]
+    return None
+
+def _linear_piece(start, length, q1, q2, c, d):
+    """Resultante F en eerste moment S = integraal q (s - c) ds van het deel
+    van een lineaire last binnen [c, d] (c, d mogen arrays zijn)"""
+    c = np.maximum(c, start)
+    d = np.maximum(c, np.minimum(d, start + length))
+    k = (q2 - q1) / length if length > 0 else 0.0
+    qc = q1 + k * (c - start)
+    qd = q1 + k * (d - start)
+    h = d - c
+    return (qc + qd) * h / 2, (qc + 2*qd) * h**2 / 6
+
+def _span_load_terms(a, b, loads):
+    """Vrij-opgelegde grootheden van alle overspanningen [a_j, b_j] tegelijk
+
+    Geeft arrays (R_a, R_b, T_a, T_b): de reacties van de losse liggers
+    (omhoog positief) en de belastingstermen van de drie-momentenvergelijking,
+    T_a = 6/L * integraal M0 (L-s) ds en T_b = 6/L * integraal M0 s ds.
+    Een last op een tussensteunpunt telt mee in de overspanning rechts ervan.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    L = b - a
+    R_a, R_b, T_a, T_b = (np.zeros_like(L) for _ in range(4))
+    closed = np.zeros(L.shape, dtype=bool)
+    closed[-1:] = True
+
+    for load in loads:
+        p, val, ltype, *rest = load
+        ltype = ltype.lower()
+        profile = distributed_profile(load)
+        if profile is not None:
+            # q(s) = alpha + beta*s in lokale coördinaat s vanaf a
+            start, length, q1, q2 = profile
+            beta = (q2 - q1) / length if length > 0 else 0.0
+            alpha = q1 + beta * (a - start)
+            s1 = np.maximum(a, start) - a
+            s2 = np.maximum(s1, np.minimum(b, start + length) - a)
+            I = [(s2**(k+1) - s1**(k+1)) / (k+1) for k in range(5)]
+            total = alpha*I[0] + beta*I[1]
+            R_b += (alpha*I[1] + beta*I[2])/L
+            R_a += total - (alpha*I[1] + beta*I[2])/L
+            T_a += (alpha*(2*L**2*I[1] - 3*L*I[2] + I[3]) + beta*(2*L**2*I[2] - 3*L*I[3] + I[4]))/L
+            T_b += (alpha*(L**2*I[1] - I[3]) + beta*(L**2*I[2] - I[4]))/L
+            continue
+
+        j = np.flatnonzero((a <= p) & ((p < b) | (closed & (p == b))))
+        if len(j) == 0:
+            continue
+        j = j[0]
+        Lj = L[j]
+        s, r = p - a[j], b[j] - p
+        if ltype == "puntlast":
+            R_a[j] += val * r/Lj
+            R_b[j] += val * s/Lj
+            T_a[j] += val * r * (Lj**2 - r**2)/Lj
+            T_b[j] += val * s * (Lj**2 - s**2)/Lj
+        elif ltype == "moment":
+            # Rechtsom positief: afgeleide van de puntlast-termen naar p
+            R_a[j] -= val/Lj
+            R_b[j] += val/Lj
+            T_a[j] -= val * (Lj**2 - 3*r**2)/Lj
+            T_b[j] += val * (Lj**2 - 3*s**2)/Lj
+
+    return R_a, R_b, T_a, T_b
+
+def _overhang_terms(x_support, loads, side):
+    """Verticale last en moment in het steunpunt door een uitkragend deel
+
+    side = "left" voor belasting links van het steunpunt, "right" voor
+    rechts. Het moment is het inwendige (doorbuigende) moment ter plaatse.
+    """
+    F = 0.0
+    M = 0.0
+    for load in loads:
+        p, val, ltype, *rest = load
+        ltype = ltype.lower()
+        profile = distributed_profile(load)
+        if profile is not None:
+            start, length = profile[:2]
+            if side == "left":
+                Q, S = _linear_piece(*profile, start, x_support)
+                F += Q
+                M -= Q * x_support - (Q * start + S)  # arm tot het steunpunt
+            else:
+                Q, S = _linear_piece(*profile, x_support, start + length)
+                F += Q
+                M -= S + Q * (max(start, x_support) - x_support)
+        elif (side == "left" and p < x_support) or (side == "right" and p > x_support):
+            if ltype == "puntlast":
+                F += val
+                M -= val * abs(p - x_support)
+            elif ltype == "moment":
+                M += val if side == "left" else -val
+    return F, M
+
+def support_reactions(supports, loads):
+    """Exacte reacties voor elk aantal steunpunten en elke mix van typen
+
+    Drie-momentenvergelijking met onbekende steunpuntsmomenten. Een
+    inklemming op een tussensteunpunt krijgt een apart moment links en
+    rechts (de rotatie is daar nul, dus de overspanningen ontkoppelen).
+    Het stelsel blijft tridiagonaal en wordt in O(n) opgelost.
+
+    Tekenconventie: reacties omhoog positief, momenten rechtsom positief.
+    Geeft {positie: R, "M_positie": moment} zoals de rest van de module.
+    """
+    supports = sorted(supports, key=lambda s: s[0])
+    R, C = support_reaction_matrix(supports, [loads])
+
+    reactions = {}
+    for i, (pos, type) in enumerate(supports):
+        reactions[pos] = R[0, i]
+        if type.lower() == "inklemming":
+            reactions[f"M_{pos}"] = C[0, i]
+    return reactions
+
+def support_reaction_matrix(supports, load_sets):
+    """Reacties voor meerdere lastsets op dezelfde ligger in één oplossing
+
+    De bandmatrix hangt alleen van de steunpunten af; alle lastsets worden
+    als kolommen van het rechterlid tegelijk opgelost. Geeft arrays R en C
+    (n_sets × n_steunpunten) met krachten en inklemmingsmomenten, in de
+    volgorde van de gesorteerde steunpunten.
+    """
+    supports = sorted(supports, key=lambda s: s[0])
+    n = len(supports)
+    k = len(load_sets)
+    if n == 0:
+        raise SupportError("Geen steunpunten opgegeven")
+    positions = np.array([s[0] for s in supports], dtype=float)
+    clamped = np.array([s[1].lower() == "inklemming" for s in supports])
+
+    if n == 1:
+        if not clamped[0]:
+            raise SupportError("Systeem met één steunpunt moet een inklemming zijn")
+        resultants = np.array([_load_resultants(loads, positions[0])
+                               for loads in load_sets]).reshape(k, 2)
+        return resultants[:, :1].copy(), -resultants[:, 1:]
+
+    L = np.diff(positions)
+    if np.any(L <= 0):
+        raise SupportError("Steunpunten mogen niet op dezelfde positie liggen")
+
+    # Belastingstermen per lastset en overspanning (k × n-1)
+    terms = np.array([_span_load_terms(positions[:-1], positions[1:], loads)
+                      for loads in load_sets]).reshape(k, 4, n - 1)
+    R_a, R_b, T_a, T_b = terms.transpose(1, 0, 2)
+    F_left, M_left = np.array([_overhang_terms(positions[0], loads, "left")
+                               for loads in load_sets]).reshape(k, 2).T
+    F_right, M_right = np.array([_overhang_terms(positions[-1], loads, "right")
+                                 for loads in load_sets]).reshape(k, 2).T
+
+    # Onbekenden: moment links (eind vorige overspanning) en rechts (begin
+    # volgende overspanning) van elk steunpunt; gelijk behalve bij een
+    # inklemming tussen twee overspanningen
+    split = clamped.copy()
+    split[[0, -1]] = False
+    right_idx = np.cumsum(1 + split) - 1   # begin van overspanning i
+    left_idx = right_idx - split           # eind van overspanning i-1
+    m = right_idx[-1] + 1
+
+    # Tridiagonaal stelsel in bandopslag: ab[1 + j - i, i] = A[i, j]
+    ab = np.zeros((3, m))
+    rhs = np.zeros((m, k))
+
+    # Eerste steunpunt
+    if clamped[0]:
+        ab[1, 0], ab[2, 0], rhs[0] = 2*L[0], L[0], -T_a[:, 0]
+    else:
+        ab[1, 0], rhs[0] = 1.0, M_left
+
+    # Tussensteunpunten
+    for i in range(1, n - 1):
+        k_l, k_r = left_idx[i], right_idx[i]
+        if split[i]:
+            # Rotatie nul: beide overspanningen ingeklemd op dit steunpunt
+            ab[0, k_l], ab[1, k_l], rhs[k_l] = L[i-1], 2*L[i-1], -T_b[:, i-1]
+            ab[1, k_r], ab[2, k_r], rhs[k_r] = 2*L[i], L[i], -T_a[:, i]
+        else:
+            ab[0, k_l] = L[i-1]
+            ab[1, k_l] = 2*(L[i-1] + L[i])
+            ab[2, k_l] = L[i]
+            rhs[k_l] = -(T_b[:, i-1] + T_a[:, i])
+
+    # Laatste steunpunt
+    if clamped[-1]:
+        ab[0, -1], ab[1, -1], rhs[-1] = L[-1], 2*L[-1], -T_b[:, -1]
+    else:
+        ab[1, -1], rhs[-1] = 1.0, M_right
+
+    moments = custom_solve_banded((1, 1), ab, rhs).T
+    M_start = moments[:, right_idx[:-1]]   # begin van elke overspanning
+    M_end = moments[:, left_idx[1:]]       # eind van elke overspanning
+
+    # Reacties: losse liggers plus dwarskracht uit de steunpuntsmomenten
+    dM = (M_end - M_start) / L
+    R = np.zeros((k, n))
+    R[:, :-1] += R_a + dM
+    R[:, 1:] += R_b - dM
+    R[:, 0] += F_left
+    R[:, -1] += F_right
+
+    # Inklemmingsmomenten: sprong in het momentenverloop over het steunpunt
+    M_left_side = np.concatenate([M_left[:, None], M_end], axis=1)
+    M_right_side = np.concatenate([M_start, M_right[:, None]], axis=1)
+    C = np.where(clamped, M_right_side - M_left_side, 0.0)
+    return R, C
+
+def _load_resultants(loads, x_ref):
+    """Totale verticale last en moment (rechtsom positief) t.o.v. x_ref"""
+    F = 0.0
+    M = 0.0
+    for load in loads:
+        p, val, ltype, *rest = load
+        ltype = ltype.lower()
+        if ltype == "puntlast":
+            F += val
+            M += val * (p - x_ref)
+        elif distributed_profile(load) is not None:
+            start, length, q1, q2 = distributed_profile(load)
+            Q, S = _linear_piece(start, length, q1, q2, start, start + length)
+            F += Q
+            M += Q * (start - x_ref) + S
+        elif ltype == "moment":
+            M += val
+    return F, M
+
+def _linear_loads(loads):
+    """Lasten lineair in hun waarde: een trapeziumlast wordt een gelijkmatige
+    last plus een driehoekslast over dezelfde lengte"""
+    result = []
+    for load in loads:
+        p, val, ltype, *rest = load
+        if ltype.lower() == "trapeziumlast":
+            result.append((p, val, "Verdeelde last", rest[0]))
+            result.append((p, rest[1] - val, "Driehoekslast", rest[0]))
+        else:
+            result.append(load)
+    return result
+
+def _load_shapes(load_cases):
+    """Splits belastinggevallen in unieke lastpatronen en hun grootte
+
+    Een lastpatroon is (positie, type, lengte) met grootte 1. Geeft de
+    patronen en de coëfficiëntenmatrix (n_gevallen × n_patronen), zodat
+    elk geval een lineaire combinatie van de patronen is.
+    """
+    index = {}
+    shapes = []
+    rows, cols, vals = [], [], []
+    for c, loads in enumerate(load_cases):
+        for load in _linear_loads(loads):
+            p, val, ltype, *rest = load
+            key = (float(p), ltype.lower(), tuple(rest))
+            if key not in index:
+                index[key] = len(shapes)
+                shapes.append((p, 1.0, ltype, *rest))
+            rows.append(c)
+            cols.append(index[key])
+            vals.append(val)
+
+    coeff = np.zeros((len(load_cases), len(shapes)))
+    np.add.at(coeff, (rows, cols), vals)
+    return shapes, coeff
+
+def _reaction_loads(reactions):
+    """Reacties als omhoog gerichte puntlasten en (rechtsom positieve) koppels"""
+    loads = []
+    for key, val in reactions.items():
+        if isinstance(key, str) and key.startswith("M_"):
+            loads.append((float(key.split("_")[1]), val, "moment"))
+        else:
+            loads.append((float(key), -val, "puntlast"))
+    return loads
+
+def _reaction_effects(x, reactions):
+    """Dwarskracht en moment door de reactiekrachten en -momenten"""
+    return _load_effects(x, _reaction_loads(reactions))
+
+def _load_effects(x, loads):
+    """Dwarskracht en moment door de uitwendige belastingen"""
+    pos, _, jumps = _load_events(loads)
+    return _event_effects(x, pos, jumps)
+
+def _load_events(loads):
+    """Sprongen per last als (posities, lastindex, sprongen)
+
+    sprongen heeft de rijen (dq, dk, dV, dM): sprong in lastintensiteit,
+    in de helling daarvan, in V (puntlast) en in M (koppel). Een
+    verdeelde last geeft twee sprongen, bij begin en eind.
+    """
+    pos, src, jumps = [], [], []
+    for i, load in enumerate(loads):
+        profile = distributed_profile(load)
+        if profile is not None:
+            start, length, q1, q2 = profile
+            if length > 0:
+                k = (q2 - q1) / length
+                pos += [start, start + length]
+                src += [i, i]
+                jumps += [(q1, k, 0.0, 0.0), (-q2, -k, 0.0, 0.0)]
+        elif load[2].lower() == "puntlast":
+            pos.append(load[0])
+            src.append(i)
+            jumps.append((0.0, 0.0, -load[1], 0.0))
+        elif load[2].lower() == "moment":
+            pos.append(load[0])
+            src.append(i)
+            jumps.append((0.0, 0.0, 0.0, load[1]))
+    return (np.array(pos, dtype=float), np.array(src, dtype=np.int64),
+            np.array(jumps, dtype=float).reshape(-1, 4).T)
+
+def _event_effects(x, pos, jumps):
+    """V en M op x uit de lastsprongen (dq, dk, dV, dM) op posities pos
+
+    De sprongen worden gesorteerd samen met het rooster; tussen twee
+    opeenvolgende posities is de last lineair, zodat V en M exact volgen
+    uit cumulatieve sommen (O((n_lasten + n_punten) log n) in plaats van
+    een n_lasten × n_punten product). jumps mag extra middelste assen
+    hebben (bijv. belastinggevallen); V en M krijgen die als voorste assen.
+    Op een knoop die samenvalt met een sprong geldt de rechterlimiet.
+    """
+    x = np.asarray(x, dtype=float)
+    events = np.unique(np.concatenate((x, pos)))
+    extra = jumps.shape[1:-1]
+    D = np.zeros((len(events), 4, *extra))
+    np.add.at(D, np.searchsorted(events, pos), np.moveaxis(jumps, -1, 0))
+    dq, dk, dV, dM = np.cumsum(D, axis=0).swapaxes(0, 1)
+
+    # dk is nu de helling van de last op [e_j, e_j+1], dq de som van de sprongen
+    h = np.diff(events).reshape(-1, *[1] * len(extra))
+    q_right = dq
+    q_right[1:] += np.cumsum(dk[:-1] * h, axis=0)
+    q_left = q_right[:-1] + dk[:-1] * h
+
+    V = dV
+    V[1:] -= np.cumsum((q_right[:-1] + q_left) * h / 2, axis=0)
+    M = dM
+    M[1:] += np.cumsum(V[:-1] * h - (2*q_right[:-1] + q_left) * h**2 / 6, axis=0)
+
+    idx = np.searchsorted(events, x)
+    return np.moveaxis(V[idx], 0, -1), np.moveaxis(M[idx], 0, -1)
+
+def _node_jumps(x, reactions, loads):
+    """Sprongen in V en M op knopen die exact op een (reactie)last liggen
+
+    V en M in de knopen zijn rechterlimieten; V - sprong en M - sprong
+    zijn de linkerlimieten.
+    """
+    pos, _, jumps = _load_events(list(loads) + _reaction_loads(reactions))
+    return _jumps_on_nodes(x, pos, jumps[2:])
+
+def _jumps_on_nodes(x, pos, jumps):
+    """Tel sprongen (k, ..., n_posities) op bij de knopen die op pos liggen"""
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    idx = np.searchsorted(x, pos)
+    on_node = (idx < n) & (x[np.minimum(idx, n - 1)] == pos)
+    result = np.zeros((*jumps.shape[:-1], n))
+    np.add.at(np.moveaxis(result, -1, 0), idx[on_node], np.moveaxis(jumps[..., on_node], -1, 0))
+    return result
+
+def load_breakpoints(beam_length, supports, loads, x_start=0, x_end=None):
+    """Alle posities waar V of M een knik of sprong heeft, binnen het rooster"""
+    x_end = beam_length if x_end is None else x_end
+    points = [x_start, x_end]
+    points += [pos for pos, _ in supports]
+    for load in loads:
+        p, val, ltype, *rest = load
+        points.append(p)
+        if distributed_profile(load) is not None:
+            points.append(p + rest[0])
+
+    points = np.unique(np.clip(np.asarray(points, dtype=float), x_start, x_end))
+    # Voeg vrijwel samenvallende punten samen
+    tol = 1e-9 * max(abs(x_end - x_start), 1.0)
+    keep = np.concatenate([[True], np.diff(points) > tol])
+    return points[keep]
+
+# Minimaal aantal inwendige knopen per segment tussen twee breekpunten
+SEGMENT_NODES = 8
+
+def adaptive_grid(beam_length, supports, loads, n_points=200, x_start=0, x_end=None):
+    """Lastbewust rekenrooster in plaats van een vaste np.linspace
+
+    Knopen liggen exact op alle steunpunten, lastposities en randen van
+    verdeelde lasten, zodat niets meer naar de dichtstbijzijnde knoop
+    verschuift. Elk segment tussen twee breekpunten krijgt eerst
+    SEGMENT_NODES gelijk verdeelde inwendige knopen (ook als het rooster
+    daardoor groter wordt dan n_points, bijv. bij veel velden). Het
+    resterende budget wordt verdeeld naar de kromming M/EI: een eerste
+    oplossing op een grof rooster bepaalt |M|, waarna de puntdichtheid
+    evenredig met 0.5 + |M|/max|M| wordt gekozen.
+    """
+    x_end = beam_length if x_end is None else x_end
+    breaks = load_breakpoints(beam_length, supports, loads, x_start, x_end)
+    t = np.arange(1, SEGMENT_NODES + 1) / (SEGMENT_NODES + 1)
+    base = np.union1d(breaks, (breaks[:-1, None] + np.diff(breaks)[:, None] * t).ravel())
+    n_free = max(n_points - len(base), 0)
+    if n_free == 0 or not loads:
+        return np.union1d(base, np.linspace(x_start, x_end, max(n_free, 2)))
+
+    # Eerste fase: grof rooster met de minimale knopen
+    coarse = np.union1d(base, np.linspace(x_start, x_end, n_free))
+    _, M = _reaction_effects(coarse, support_reactions(supports, loads))
+    _, M_load = _load_effects(coarse, loads)
+    M_abs = np.abs(M + M_load)
+
+    # Tweede fase: gelijkverdeling van de gewichtsfunctie over het rooster
+    peak = M_abs.max()
+    weight = 0.5 + (M_abs/peak if peak > 0 else 0.0)
+    W = cumulative_integrate(weight, coarse)
+    targets = np.linspace(0, W[-1], n_free + 2)[1:-1]
+    refined = np.interp(targets, W, coarse)
+    return np.union1d(base, refined)
+
+def internal_forces(x, reactions, loads):
+    """Dwarskracht en moment op rooster x uit reacties en belastingen"""
+    V, M = _reaction_effects(x, reactions)
+    V_load, M_load = _load_effects(x, loads)
+    return V + V_load, M + M_load
+
+def deflection(x, supports, reactions, loads, M, EI, V=None):
+    """Hoekverdraaiing en doorbuiging bij momentenlijn M op rooster x
+
+    Met de dwarskracht V wordt exact (Hermite) geïntegreerd.
+    """
+    V_jumps, M_jumps = _node_jumps(x, reactions, loads)
+    V_left = None if V is None else V - V_jumps
+    return integrate_deflection(x, supports, M, EI, M - M_jumps, V, V_left)
+
+def integrate_deflection(x, supports, M, EI, M_left=None, V=None, V_left=None):
+    """Dubbele integratie van M/EI; M mag (n,) of (n_gevallen, n) zijn
+
+    M_left en V_left bevatten de linkerlimieten bij sprongen op knopen.
+    Met V gebeuren beide integraties met method="exact" (dM/dx = V,
+    dtheta/dx = M/EI): exact voor theta bij gelijkmatige lasten en
+    vierde-orde nauwkeurig voor y; zonder V met de trapeziumregel.
+    """
+    M_left = M if M_left is None else M_left
+    if V is None:
+        theta = cumulative_integrate(M / EI, x, y_left=M_left / EI)
+        y = cumulative_integrate(theta, x)
+    else:
+        V_left = V if V_left is None else V_left
+        theta = cumulative_integrate(M / EI, x, method="exact", dydx=V / EI,
+                                     y_left=M_left / EI, dydx_left=V_left / EI)
+        y = cumulative_integrate(theta, x, method="exact", dydx=M / EI, dydx_left=M_left / EI)
+
+    # Pas randvoorwaarden aan (zelfde matrix voor alle gevallen)
+    A = []
+    b = []
+    for pos, type in supports:
+        idx = np.abs(x - pos).argmin()
+        if type.lower() == "inklemming":
+            A.append([x[idx], 1])  # y = 0
+            A.append([1, 0])       # dy/dx = 0
+            b.extend([-y[..., idx], -theta[..., idx]])
+        else:
+            A.append([x[idx], 1])
+            b.append(-y[..., idx])
+
+    # Los kleinste kwadraten op
+    A = np.array(A)
+    b = np.array(b)
+
+    try:
+        C, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
+        slope = np.asarray(C[0])[..., None]
+        offset = np.asarray(C[1])[..., None]
+        # Rotatie krijgt dezelfde correctie als de doorbuigingslijn
+        return theta + slope, y + slope*x + offset
+    except:
+        # Fallback als lstsq faalt
+        # Verschuif zodat eerste steunpunt op 0 ligt
+        idx = np.abs(x - supports[0][0]).argmin()
+        return theta, y - y[..., idx:idx+1]
+
+# Interne Chebyshev-punten per segment voor het exact fitten van M (graad 3)
+_FIT_NODES = 0.5 - 0.5 * np.cos((2 * np.arange(4) + 1) * np.pi / 8)
+_FIT_INVERSE = np.linalg.inv(np.vander(_FIT_NODES, 4, increasing=True))
 
 class BeamSolver:
-    def __init__(self, beam_length, supports, loads, EI):
+    def __init__(self, beam_length, supports, loads, EI, x=None, n_points=200):
         self.L = beam_length
         self.supports = sorted(supports, key=lambda x: x[0])
         self.loads = loads
         self.EI = EI
-        self.x = np.linspace(0, beam_length, 500)
         self._validate_input()
+        # Eigen (oplopend) rekenrooster of een lastbewust adaptief rooster
+        if x is None:
+            self.x = adaptive_grid(beam_length, self.supports, loads, n_points)
+        else:
+            self.x = np.asarray(x, dtype=float)
 
     def _validate_input(self):
         """Controleer invoerconsistentie"""
         if any(pos < 0 or pos > self.L for pos, _ in self.supports):
-            raise ValueError("Ongeldige steunpuntpositie")
+            raise SupportError("Ongeldige steunpuntpositie")
         if self.EI <= 0:
-            raise ValueError("Buigstijfheid moet positief zijn")
+            raise BeamError("Buigstijfheid moet positief zijn")
+        validate_loads(self.loads)
+
+    def solve(self, store=None):
+        """Hoofdberekeningsroutine
+
+        Met een ResultStore wordt eerst op modelhash gezocht en wordt een
+        nieuw resultaat daarna opgeslagen.
+        """
+        if store is not None:
+            key = self.model_key()
+            stored = store.get(key)
+            if stored is not None:
+                self.x = stored['x']
+                self.V, self.M = stored['V'], stored['M']
+                self.theta, self.y = stored['theta'], stored['y']
+                self.reactions = stored['reactions']
+                return self.get_results()
 
-    def solve(self):
-        """Hoofdberekeningsroutine"""
         self._calculate_reactions()
         self._calculate_internal_forces()
         self._calculate_deflection()
+        if store is not None:
+            store.put(key, self.get_results())
         return self.get_results()
 
+    def model_key(self):
+        """Modelhash van ligger, belasting, EI en rekenrooster"""
+        from result_cache import model_hash
+
+        grid = hashlib.sha256(np.ascontiguousarray(self.x, dtype=np.float64).tobytes()).hexdigest()
+        return model_hash(self.L, self.supports, self.loads, EI=self.EI, grid=grid)
+
+    def solve_batch(self, load_cases):
+        """Los veel belastinggevallen op dezelfde ligger in één keer op
+
+        Superpositie: elk uniek lastpatroon wordt één keer met grootte 1
+        doorgerekend, daarna volgen alle gevallen uit de met de
+        coëfficiëntenmatrix geschaalde lastsprongen. Geeft gestapelde
+        arrays (n_gevallen × n_punten) voor V, M, theta en y; de reacties
+        zijn arrays per steunpunt met dezelfde sleutels als bij solve().
+        """
+        shapes, coeff = _load_shapes(load_cases)
+        positions = np.array([s[0] for s in self.supports], dtype=float)
+        n_supports = len(positions)
+
+        if shapes:
+            R, C = support_reaction_matrix(self.supports, [[s] for s in shapes])
+        else:
+            R = C = np.zeros((0, n_supports))
+        R_cases = coeff @ R
+        C_cases = coeff @ C
+
+        # Sprongen van de eenheidspatronen, geschaald per geval, plus de
+        # reacties als omhoog gerichte puntlasten en koppels
+        pos, src, unit = _load_events(shapes)
+        reaction_jumps = np.zeros((4, len(coeff), 2 * n_supports))
+        reaction_jumps[2, :, :n_supports] = R_cases
+        reaction_jumps[3, :, n_supports:] = C_cases
+        pos = np.concatenate((pos, positions, positions))
+        jumps = np.concatenate((unit[:, None, :] * coeff[:, src], reaction_jumps), axis=-1)
+        V, M = _event_effects(self.x, pos, jumps)
+
+        # Sprongen in V en M op knopen (lasten, reacties en inklemmingen)
+        V_jumps, M_jumps = _jumps_on_nodes(self.x, pos, jumps[2:])
+        theta, y = self._integrate_deflection(M, M - M_jumps, V, V - V_jumps)
+
+        reactions = {}
+        for i, (pos, type) in enumerate(self.supports):
+            reactions[pos] = R_cases[:, i]
+            if type.lower() == "inklemming":
+                reactions[f"M_{pos}"] = C_cases[:, i]
+
+        return {
+            'x': self.x,
+            'V': V,
+            'M': M,
+            'y': y,
+            'theta': theta,
+            'reactions': reactions
+        }
+
+    def solve_piecewise(self):
+        """Exacte resultaten als stuksgewijze polynomen tussen de breekpunten
+
+        M is per segment een polynoom van hooguit graad 3 en wordt uit vier
+        inwendige punten exact bepaald; V, theta en y volgen door
+        differentiëren en integreren zonder rooster. Geeft een dict met
+        PiecewisePolynomial voor V, M, theta en y plus de reacties.
+        """
+        self._calculate_reactions()
+        breaks = load_breakpoints(self.L, self.supports, self.loads, self.x[0], self.x[-1])
+        h = np.diff(breaks)
+
+        # Inwendige punten: sprongen op breekpunten spelen geen rol
+        xs = (breaks[:-1, None] + h[:, None] * _FIT_NODES).ravel()
+        _, M_r = _reaction_effects(xs, self.reactions)
+        _, M_l = _load_effects(xs, self.loads)
+        coeffs = (M_r + M_l).reshape(-1, 4) @ _FIT_INVERSE.T
+
+        M = PiecewisePolynomial(breaks, coeffs)
+        theta = M.scaled(1.0 / self.EI).antiderivative()
+        y = theta.antiderivative()
+
+        # Randvoorwaarden: y = 0 op steunpunten, theta = 0 bij inklemmingen
+        A = []
+        b = []
+        for pos, type in self.supports:
+            A.append([pos, 1])
+            b.append(-y(pos))
+            if type.lower() == "inklemming":
+                A.append([1, 0])
+                b.append(-theta(pos))
+        slope, offset = np.linalg.lstsq(np.array(A, dtype=float), np.array(b), rcond=None)[0]
+
+        return {
+            'V': M.derivative(),
+            'M': M,
+            'theta': theta.plus_linear(slope),
+            'y': y.plus_linear(offset, slope),
+            'reactions': self.reactions
+        }
+
     def get_results(self):
         return {
             'x': self.x,
@@ -56,259 +805,17 @@ class BeamSolver:
 
     def _calculate_reactions(self):
         """Bepaal reactiekrachten met drie-momentenvergelijking"""
-        n = len(self.supports)
-        support_pos = [s[0] for s in self.supports]
-
-        if n == 1:  # Inklemming
-            self._fixed_support_reactions()
-        elif n == 2:  # Statisch bepaald
-            self._simple_beam_reactions()
-        else:  # Statisch onbepaald
-            self._continuous_beam_reactions()
-
-    def _fixed_support_reactions(self):
-        """Reacties voor ingeklemde balk"""
-        pos = self.supports[0][0]
-        V_total = 0
-        M_total = 0
-
-        for load in self.loads:
-            p, val, ltype, *rest = load
-            if ltype.lower() == "puntlast":
-                V_total += val
-                M_total += val * (p - pos)
-            elif ltype.lower() == "verdeelde last":
-                length = rest[0]
-                q = val
-                V_total += q * length
-                M_total += q * length * (p + length/2 - pos)
-            elif ltype.lower() == "moment":
-                M_total += val
-
-        self.reactions = {pos: -V_total, f"M_{pos}": -M_total}
-
-    def _simple_beam_reactions(self):
-        """Statisch bepaalde ligger met 2 steunpunten"""
-        a, b = [s[0] for s in self.supports]
-        L = b - a
-        R_a, R_b = 0, 0
-        M_a, M_b = 0, 0
-
-        for load in self.loads:
-            p, val, ltype, *rest = load
-            if ltype.lower() == "puntlast":
-                R_a += val * (b - p)/L
-                R_b += val * (p - a)/L
-            elif ltype.lower() == "verdeelde last":
-                q, length = val, rest[0]
-                x1 = max(a, p)
-                x2 = min(b, p + length)
-                if x1 < x2:
-                    R_a += q * ((x2**2 - x1**2)/(2*L) - a*(x2 - x1)/L)
-                    R_b += q * (b*(x2 - x1)/L - (x2**2 - x1**2)/(2*L))
-            elif ltype.lower() == "moment":
-                M_a += val * (b - p)/L
-                M_b += val * (p - a)/L
-
-        self.reactions = {a: R_a, b: R_b}
-        
-        # Voeg inklemming momenten toe indien nodig
-        if self.supports[0][1].lower() == "inklemming":
-            self.reactions[f"M_{a}"] = M_a
-        if self.supports[1][1].lower() == "inklemming":
-            self.reactions[f"M_{b}"] = M_b
-
-    def _continuous_beam_reactions(self):
-        """Drie-momentenvergelijking voor doorlopende liggers"""
-        n = len(self.supports)
-        positions = [s[0] for s in self.supports]
-        L = [positions[i+1] - positions[i] for i in range(n-1)]
-        
-        # Bouw matrix voor driemomentenvergelijking
-        A = np.zeros((n, n))
-        rhs = np.zeros(n)
-
-        # Vul matrix voor interne steunpunten
-        for i in range(1, n-1):
-            A[i, i-1] = L[i-1]
-            A[i, i] = 2*(L[i-1] + L[i])
-            A[i, i+1] = L[i]
-            rhs[i] = -6*(self._calc_free_moment(i-1) + self._calc_free_moment(i))
-
-        # Randvoorwaarden
-        A[0, 0] = 1  # M0 = 0
-        A[-1, -1] = 1  # Mn = 0
-        
-        try:
-            # Los matrix op
-            moments = np.linalg.solve(A, rhs)
-        except:
-            # Fallback als solve faalt
-            # Vereenvoudigde methode: verdeel belasting over steunpunten
-            self.reactions = {}
-            total_load = 0
-            for load in self.loads:
-                pos, value, load_type, *rest = load
-                if load_type.lower() == "puntlast":
-                    total_load += value
-                elif load_type.lower() == "verdeelde last":
-                    length = rest[0]
-                    total_load += value * length
-            
-            # Verdeel belasting over steunpunten
-            weights = []
-            for i in range(n):
-                if i == 0 or i == n-1:
-                    weights.append(0.5)  # Randsteunpunten krijgen minder
-                else:
-                    weights.append(1.0)  # Tussensteunpunten krijgen meer
-            
-            total_weight = sum(weights)
-            for i, (pos, _) in enumerate(self.supports):
-                self.reactions[pos] = -total_load * weights[i] / total_weight
-            
-            return
-
-        # Bereken reacties uit momenten
-        self.reactions = {}
-        for i in range(n):
-            R = 0
-            if i > 0:
-                R += (moments[i-1] + moments[i])/(2*L[i-1])
-            if i < n-1:
-                R += (moments[i] + moments[i+1])/(2*L[i])
-            R += self._point_load_contribution(positions[i])
-            self.reactions[positions[i]] = R
-            
-            # Voeg inklemming momenten toe indien nodig
-            if self.supports[i][1].lower() == "inklemming":
-                self.reactions[f"M_{positions[i]}"] = moments[i]
-
-    def _calc_free_moment(self, span_idx):
-        """Bereken vrije veldmoment voor overspanning"""
-        x1 = self.supports[span_idx][0]
-        x2 = self.supports[span_idx+1][0]
-        M = 0
-
-        for load in self.loads:
-            p, val, ltype, *rest = load
-            if ltype.lower() == "puntlast" and x1 <= p <= x2:
-                a = p - x1
-                L = x2 - x1
-                M += val * a * (L**2 - a**2) / (6*L)
-            elif ltype.lower() == "verdeelde last":
-                start = max(x1, p)
-                end = min(x2, p + rest[0])
-                if start < end:
-                    a = start - x1
-                    b = end - x1
-                    L = x2 - x1
-                    M += val * (b**3 - a**3)/(6*L) - val * (b**4 - a**4)/(24*L**2)
-        return M
-
-    def _point_load_contribution(self, pos):
-        """Bijdrage puntlasten op steunpunt"""
-        return sum(load[1] for load in self.loads 
-                 if load[2].lower() == "puntlast" and abs(load[0] - pos) < 1e-6)
+        self.reactions = support_reactions(self.supports, self.loads)
 
     def _calculate_internal_forces(self):
         """Bereken dwarskrachten en momentenlijn"""
-        self.V = np.zeros_like(self.x)
-        self.M = np.zeros_like(self.x)
-
-        # Verzamel steunpunt posities voor controle
-        support_positions = [s[0] for s in self.supports]
-
-        # Reactiekrachten
-        for pos, R in self.reactions.items():
-            if not pos.startswith("M_"):  # Alleen krachten, geen momenten
-                idx = np.searchsorted(self.x, float(pos))
-                if idx < len(self.x):
-                    self.V[idx:] += R
-                    self.M[idx:] += R * (self.x[idx:] - float(pos))
-        
-        # Reactiemomenten
-        for key, val in self.reactions.items():
-            if key.startswith("M_"):
-                pos = float(key.split("_")[1])
-                idx = np.searchsorted(self.x, pos)
-                if idx < len(self.x):
-                    # Moment heeft geen effect op dwarskracht, alleen op moment
-                    self.M[idx:] += val
-
-        # Uitwendige belastingen
-        for load in self.loads:
-            pos, val, ltype, *rest = load
-            
-            # Controleer of de last op een steunpunt valt
-            on_support = any(abs(pos - sp) < 1e-6 for sp in support_positions)
-            
-            if ltype.lower() == "puntlast":
-                # Als de puntlast op een steunpunt valt, wordt deze direct opgenomen
-                if not on_support:
-                    self._apply_point_load(pos, val)
-            elif ltype.lower() == "verdeelde last":
-                self._apply_distributed_load(pos, val, rest[0])
-            elif ltype.lower() == "moment":
-                self._apply_moment(pos, val)
-
-    def _apply_point_load(self, pos, P):
-        idx = np.searchsorted(self.x, pos)
-        self.V[idx:] -= P
-        self.M[idx:] -= P * (self.x[idx:] - pos)
-
-    def _apply_distributed_load(self, start, q, length):
-        end = start + length
-        start_idx = np.searchsorted(self.x, start)
-        end_idx = np.searchsorted(self.x, end)
-
-        # Onder belasting
-        for i in range(start_idx, min(end_idx, len(self.x))):
-            dx = self.x[i] - start
-            self.V[i] -= q * dx
-            self.M[i] -= 0.5 * q * dx**2
-
-        # Na belasting
-        if end_idx < len(self.x):
-            self.V[end_idx:] -= q * length
-            self.M[end_idx:] -= q * length * (self.x[end_idx:] - start - 0.5*length)
-
-    def _apply_moment(self, pos, M):
-        idx = np.searchsorted(self.x, pos)
-        if idx < len(self.x):
-            self.M[idx:] -= M
+        self.V, self.M = internal_forces(self.x, self.reactions, self.loads)
 
     def _calculate_deflection(self):
         """Bereken doorbuiging via dubbele integratie"""
-        # Eerste integratie: hoekverdraaiing
-        self.theta = custom_cumtrapz(self.M / self.EI, self.x, initial=0)
-
-        # Tweede integratie: doorbuiging
-        y = custom_cumtrapz(self.theta, self.x, initial=0)
+        self.theta, self.y = deflection(self.x, self.supports, self.reactions, self.loads,
+                                        self.M, self.EI, self.V)
 
-        # Pas randvoorwaarden aan
-        A = []
-        b = []
-        for pos, type in self.supports:
-            idx = np.abs(self.x - pos).argmin()
-            if type.lower() == "inklemming":
-                A.append([self.x[idx], 1])  # y = 0
-                A.append([1, 0])           # dy/dx = 0
-                b.extend([-y[idx], -self.theta[idx]])
-            else:
-                A.append([self.x[idx], 1])
-                b.append(-y[idx])
-
-        # Los kleinste kwadraten op
-        A = np.array(A)
-        b = np.array(b)
-        
-        try:
-            C, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-            self.y = y + C[0]*self.x + C[1]
-        except:
-            # Fallback als lstsq faalt
-            self.y = y
-            # Verschuif zodat eerste steunpunt op 0 ligt
-            idx = np.abs(self.x - self.supports[0][0]).argmin()
-            self.y -= self.y[idx]
+    def _integrate_deflection(self, M, M_left=None, V=None, V_left=None):
+        """Dubbele integratie op het eigen rooster"""
+        return integrate_deflection(self.x, self.supports, M, self.EI, M_left, V, V_left)
@@ -0,0 +1,47 @@
+"""Uitdunnen van resultaatlijnen voor weergave, met behoud van extrema
+
+Per pixelkolom (een gelijk x-interval) blijven alleen het minimum en het
+maximum over, plus het eerste en laatste punt. De getekende lijn is dan
+visueel gelijk aan de volledige, maar de grootte hangt af van de
+schermbreedte in plaats van de roosterfijnheid.
+"""
+import numpy as np
+
+# Standaard plotbreedte (px) en maximum aantal punten per figuur
+PLOT_WIDTH_PX = 1000
+MAX_PLOT_POINTS = 16000
+# Boven dit aantal punten per lijn tekent de app met WebGL (Scattergl)
+WEBGL_POINTS = 1000
+
+def minmax_indices(x, y, n_buckets):
+    """Indices (oplopend) van min en max per x-interval
+
+    Met hooguit 2 × n_buckets punten wordt niets weggelaten.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= 2 * n_buckets or n < 3:
+        return np.arange(n)
+
+    span = x[-1] - x[0]
+    if span > 0:
+        bucket = np.minimum(((x - x[0]) / span * n_buckets).astype(np.int64), n_buckets - 1)
+    else:
+        bucket = np.arange(n) * n_buckets // n
+
+    # Binnen elke bucket gesorteerd op y: eerste = min, laatste = max
+    order = np.lexsort((y, bucket))
+    sorted_buckets = bucket[order]
+    first = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    last = np.r_[first[1:] - 1, n - 1]
+    return np.unique(np.concatenate((order[first], order[last], [0, n - 1])))
+
+def minmax_decimate(x, y, n_buckets=PLOT_WIDTH_PX):
+    """(x, y) uitgedund tot hooguit ~2 × n_buckets punten"""
+    idx = minmax_indices(x, y, n_buckets)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
+def plot_buckets(n_traces, width_px=PLOT_WIDTH_PX, max_points=MAX_PLOT_POINTS):
+    """Aantal buckets per lijn: schermbreedte, begrensd door het puntenbudget"""
+    return max(1, min(int(width_px), int(max_points) // (2 * max(n_traces, 1))))
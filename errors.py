@@ -0,0 +1,21 @@
+"""Foutklassen van de rekenkern
+
+Alle fouten zijn ook ValueError, zodat bestaande `except ValueError`
+blijft werken; de UI vertaalt ze naar meldingen.
+"""
+import numpy as np
+
+class BeamError(ValueError):
+    """Basis voor ongeldige invoer of onoplosbare liggers"""
+
+class SupportError(BeamError):
+    """Ongeldige of onvoldoende steunpunten"""
+
+class LoadError(BeamError):
+    """Ongeldige belasting"""
+
+class SectionError(BeamError):
+    """Ongeldige profielafmetingen of onbekend profieltype"""
+
+class SingularSystemError(BeamError, np.linalg.LinAlgError):
+    """Stelsel zonder unieke oplossing (bijv. mechanisme)"""
@@ -0,0 +1,44 @@
+import numpy as np
+
+def extremum(pp, kind="abs"):
+    """Exact extremum van een PiecewisePolynomial met bijbehorende positie
+
+    Kandidaten zijn de segmentranden (linker- en rechterlimieten, zodat
+    sprongen meetellen) en de nulpunten van de afgeleide per segment.
+    kind: "abs" (grootste |waarde|, teken behouden), "max" of "min".
+    Geeft (waarde, x).
+    """
+    start, end = pp.end_values()
+    values = [start, end]
+    positions = [pp.breaks[:-1], pp.breaks[1:]]
+
+    # Stationaire punten binnen de segmenten
+    roots = pp.derivative().roots()
+    if len(roots):
+        values.append(pp(roots))
+        positions.append(roots)
+
+    values = np.concatenate(values)
+    positions = np.concatenate(positions)
+    if kind == "abs":
+        i = np.argmax(np.abs(values))
+    elif kind == "max":
+        i = np.argmax(values)
+    elif kind == "min":
+        i = np.argmin(values)
+    else:
+        raise ValueError(f"Onbekend soort extremum: {kind}")
+    return values[i], positions[i]
+
+def beam_extremes(results, kind="abs"):
+    """Extrema van V, M, theta en y uit BeamSolver.solve_piecewise()"""
+    return {key: extremum(results[key], kind) for key in ('V', 'M', 'theta', 'y')}
+
+def sampled_extremes(x, kind="abs", **arrays):
+    """Zelfde uitvoer als beam_extremes, maar uit bemonsterde arrays"""
+    pick = {"abs": lambda a: np.argmax(np.abs(a)), "max": np.argmax, "min": np.argmin}[kind]
+    extremes = {}
+    for key, values in arrays.items():
+        i = pick(values)
+        extremes[key] = (values[i], x[i])
+    return extremes
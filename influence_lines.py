@@ -0,0 +1,144 @@
+import hashlib
+
+import numpy as np
+
+from beam_solver import BeamSolver, distributed_profile
+from errors import LoadError
+from result_cache import ResultCache, model_hash
+
+class InfluenceLines:
+    """Invloedslijnen van één ligger: responsies op een eenheidslast
+
+    Voor elke roosterpositie x_j wordt één keer een eenheidspuntlast en een
+    eenheidsmoment doorgerekend (via BeamSolver.solve_batch). Rij j van V,
+    M, theta en y is de responsie op het hele rooster door een last 1 op
+    x_j, rij n + j die door een moment 1 op x_j; reactions bevat de
+    bijbehorende steunpuntsreacties. Elke lastset is daarna een
+    matrix-vectorproduct met de equivalente knooplasten.
+
+    Met moments=False worden alleen de n puntlastrijen opgebouwd (half
+    zo veel geheugen en rekentijd); momentlasten zijn dan niet mogelijk.
+    """
+
+    def __init__(self, beam_length, supports, EI, x=None, moments=True):
+        solver = BeamSolver(beam_length, supports, [], EI, x=x)
+        self.x = solver.x
+        self.supports = solver.supports
+        self.moments = moments
+
+        # Eenheidspuntlasten (en eventueel eenheidsmomenten) op alle knopen in één batch
+        n = len(self.x)
+        unit_loads = [[(xj, 1.0, "Puntlast")] for xj in self.x]
+        if moments:
+            unit_loads += [[(xj, 1.0, "Moment")] for xj in self.x]
+        result = solver.solve_batch(unit_loads)
+        self.reaction_keys = list(result['reactions'])
+        reactions = np.column_stack([result['reactions'][k] for k in self.reaction_keys])
+
+        # Per grootheid: (knooplasten + knoopmomenten) × n_punten
+        self.V = result['V']
+        self.M = result['M']
+        self.theta = result['theta']
+        self.y = result['y']
+        self.reactions = reactions
+        self.n_nodes = n
+        self.n_rows = len(unit_loads)
+        for array in (self.V, self.M, self.theta, self.y, self.reactions):
+            array.flags.writeable = False  # gedeeld via de cache
+
+    @property
+    def nbytes(self):
+        """Geheugengebruik van de invloedsmatrices"""
+        return sum(a.nbytes for a in (self.V, self.M, self.theta, self.y, self.reactions))
+
+    def load_vector(self, loads):
+        """Equivalente knooplasten voor een lastset
+
+        Geeft een vector (n_rows,): eerst de knoopkrachten, dan (met
+        moments=True) de knoopmomenten. Een puntlast of moment precies op
+        een knoop is exact. Een last tussen twee knopen wordt lineair over
+        de buren verdeeld; dat is een benadering (tweede-orde in de
+        knoopafstand), ook voor de reacties en V, want bij statisch
+        onbepaalde liggers zijn de invloedslijnen kubisch in de
+        lastpositie. Verdeelde lasten worden op dezelfde manier benaderd.
+        """
+        x = self.x
+        n = self.n_nodes
+        f = np.zeros(self.n_rows)
+        for load in loads:
+            p, val, ltype, *rest = load
+            ltype = ltype.lower()
+            profile = distributed_profile(load)
+            if profile is not None:
+                _add_distributed(f[:n], x, *profile)
+                continue
+
+            j, t = _locate(x, p)
+            if ltype == "puntlast":
+                f[j] += val * (1 - t)
+                f[j+1] += val * t
+            elif ltype == "moment":
+                if not self.moments:
+                    raise LoadError("Invloedslijnen zonder momentrijen (moments=False)")
+                f[n + j] += val * (1 - t)
+                f[n + j+1] += val * t
+        return f
+
+    def evaluate(self, loads):
+        """Resultaten voor één lastset, zelfde opbouw als BeamSolver.solve()"""
+        return self.evaluate_vectors(self.load_vector(loads))
+
+    def evaluate_batch(self, load_cases):
+        """Gestapelde resultaten (n_gevallen × n_punten) voor veel lastsets"""
+        F = np.array([self.load_vector(loads) for loads in load_cases]).reshape(-1, self.n_rows)
+        return self.evaluate_vectors(F)
+
+    def evaluate_vectors(self, f):
+        """Resultaten voor knooplastvector(en) f: (n_rows,) of (n_gevallen, n_rows)"""
+        R = f @ self.reactions
+        return {
+            'x': self.x,
+            'V': f @ self.V,
+            'M': f @ self.M,
+            'y': f @ self.y,
+            'theta': f @ self.theta,
+            'reactions': {k: R[..., i] for i, k in enumerate(self.reaction_keys)}
+        }
+
+def _locate(x, p):
+    """Interval j en lokale coördinaat t van positie p op het rooster"""
+    j = int(np.clip(np.searchsorted(x, p, side="right") - 1, 0, len(x) - 2))
+    h = x[j+1] - x[j]
+    t = float(np.clip((p - x[j]) / h, 0.0, 1.0)) if h > 0 else 0.0
+    return j, t
+
+def _add_distributed(f, x, start, length, q1, q2):
+    """Exacte integraal van de lineaire last q maal de hoedfuncties"""
+    x0, x1 = x[:-1], x[1:]
+    h = x1 - x0
+    lo = np.clip(start, x0, x1)
+    hi = np.clip(start + length, x0, x1)
+    k = (q2 - q1) / length if length > 0 else 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_lo = np.where(h > 0, (lo - x0) / h, 0.0)
+        t_hi = np.where(h > 0, (hi - x0) / h, 0.0)
+    # q = q0 + k*h*t binnen het element
+    q0 = q1 + k * (x0 - start)
+    d1 = t_hi - t_lo
+    d2 = (t_hi**2 - t_lo**2)/2
+    d3 = (t_hi**3 - t_lo**3)/3
+    f[:-1] += h * (q0 * (d1 - d2) + k * h * (d2 - d3))
+    f[1:] += h * (q0 * d2 + k * h * d3)
+
+# Begrensd op aantal én geheugen: één ligger met n knopen kost 2n × n
+# float64 per grootheid (64 MB per grootheid bij n = 1000)
+influence_cache = ResultCache(maxsize=32, max_bytes=512 * 1024**2)
+
+def influence_lines(beam_length, supports, EI, x=None, moments=True):
+    """Gecachte InfluenceLines per (balklengte, steunpunten, EI, rooster)"""
+    grid = None if x is None else hashlib.sha256(np.ascontiguousarray(x, dtype=np.float64).tobytes()).hexdigest()
+    key = model_hash(beam_length, supports, [], EI=EI, grid=grid, moments=int(moments))
+    il = influence_cache.get(key)
+    if il is None:
+        il = influence_cache.put(key, InfluenceLines(beam_length, supports, EI, x=x, moments=moments))
+    return il
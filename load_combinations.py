@@ -0,0 +1,135 @@
+from itertools import combinations as subsets
+
+import numpy as np
+
+from beam_solver import BeamSolver
+
+# Categorieën van belastinggevallen
+PERMANENT = "permanent"
+VARIABLE = "variabel"
+SNOW = "sneeuw"
+WIND = "wind"
+
+# Standaardfactoren volgens EN 1990 (tabel A1.1 en A1.2(B)), te overschrijven
+PARTIAL_FACTORS = {"permanent": 1.35, "permanent_gunstig": 1.0, "variabel": 1.5}
+PSI_0 = {VARIABLE: 0.7, SNOW: 0.5, WIND: 0.6}
+
+def standard_combinations(categories, limit_state="ULS", factors=None, psi_0=None):
+    """Combinatieregels (naam, {geval: factor}) voor UGT of BGT
+
+    categories: {naam belastinggeval: categorie}. Per variabele last als
+    hoofdlast volgt één combinatie; de overige variabele lasten tellen mee
+    met psi_0, en de combinatie komt ook voor met elke deelverzameling
+    daarvan weggelaten (gunstig werkende variabele lasten, bijv. wind
+    tegen de nuttige last in). Bij "ULS" krijgen permanente lasten
+    gamma_G (ongunstig), variabele lasten gamma_Q; elke combinatie komt
+    daarnaast voor met elke
+    deelverzameling permanente gevallen op gamma_G,inf ("permanent_gunstig"),
+    zodat de omhullende ook gunstig werkend eigengewicht dekt (bijv. bij
+    uitkragingen). "SLS" is de karakteristieke combinatie.
+    """
+    factors = {**PARTIAL_FACTORS, **(factors or {})}
+    psi_0 = {**PSI_0, **(psi_0 or {})}
+    limit_state = limit_state.upper()
+    if limit_state == "ULS":
+        gamma_G, gamma_Q = factors["permanent"], factors["variabel"]
+        gamma_G_inf = factors["permanent_gunstig"]
+    elif limit_state == "SLS":
+        gamma_G, gamma_Q = 1.0, 1.0
+        gamma_G_inf = gamma_G
+    else:
+        raise ValueError(f"Onbekende grenstoestand: {limit_state}")
+
+    permanent = [name for name, cat in categories.items() if cat.lower() == PERMANENT]
+    variable = [name for name, cat in categories.items() if cat.lower() != PERMANENT]
+    unknown = {categories[name] for name in variable} - set(psi_0)
+    if unknown:
+        raise ValueError(f"Onbekende categorie: {', '.join(sorted(unknown))}")
+
+    base = {name: gamma_G for name in permanent}
+    combinations = [(f"{limit_state}: {' + '.join(permanent) or 'geen'}", dict(base))]
+    for lead in variable:
+        others = [other for other in variable if other != lead]
+        # Begeleidende lasten die gunstig werken tellen niet mee: elke
+        # deelverzameling ervan komt ook weggelaten voor
+        for size in range(len(others) + 1):
+            for omitted in subsets(others, size):
+                rule = dict(base)
+                rule[lead] = gamma_Q
+                for other in others:
+                    if other not in omitted:
+                        rule[other] = gamma_Q * psi_0[categories[other].lower()]
+                suffix = f" (zonder {', '.join(omitted)})" if omitted else ""
+                combinations.append((f"{limit_state}: {lead} hoofdlast{suffix}", rule))
+
+    if gamma_G_inf == gamma_G:
+        return combinations
+    # Varianten met gunstig werkende permanente gevallen
+    variants = []
+    for name, rule in combinations:
+        variants.append((name, rule))
+        for size in range(1, len(permanent) + 1):
+            for favourable in subsets(permanent, size):
+                variant = dict(rule)
+                variant.update((case, gamma_G_inf) for case in favourable)
+                variants.append((f"{name} ({', '.join(favourable)} gunstig)", variant))
+    return variants
+
+def combine_load_cases(beam_length, supports, EI, load_cases, combinations, x=None, n_points=200):
+    """Resultaten en omhullenden van belastingcombinaties via superpositie
+
+    load_cases: {naam: lijst lasten}; combinations: lijst (naam, {geval:
+    factor}). Elk belastinggeval wordt één keer opgelost (solve_batch);
+    de combinaties zijn daarna één matrixproduct met de factorenmatrix.
+
+    Geeft 'x', 'cases', 'combinations' (namen), 'results' met per
+    grootheid een array (n_combinaties × n_punten) en per combinatie de
+    reacties, en 'envelope' met per grootheid {'max', 'min', 'max_by',
+    'min_by'}: *_by is de index van de maatgevende combinatie per punt.
+    """
+    cases = list(load_cases)
+    index = {name: i for i, name in enumerate(cases)}
+    factors = np.zeros((len(combinations), len(cases)))
+    for c, (name, rule) in enumerate(combinations):
+        for case, factor in rule.items():
+            if case not in index:
+                raise ValueError(f"Onbekend belastinggeval in combinatie {name}: {case}")
+            factors[c, index[case]] = factor
+
+    # Eén rooster voor alle gevallen, met breekpunten van elke last
+    all_loads = [load for name in cases for load in load_cases[name]]
+    solver = BeamSolver(beam_length, supports, all_loads, EI, x=x, n_points=n_points)
+    per_case = solver.solve_batch([load_cases[name] for name in cases])
+
+    results = {key: factors @ per_case[key] for key in ('V', 'M', 'theta', 'y')}
+    results['reactions'] = {key: factors @ val for key, val in per_case['reactions'].items()}
+
+    envelope = {key: _envelope(results[key]) for key in ('V', 'M', 'theta', 'y')}
+    envelope['reactions'] = {key: _envelope(val) for key, val in results['reactions'].items()}
+
+    return {
+        'x': solver.x,
+        'cases': cases,
+        'combinations': [name for name, _ in combinations],
+        'results': results,
+        'envelope': envelope,
+    }
+
+def governing_combination(combined, key="M"):
+    """Naam en positie van de combinatie met de grootste |waarde| van key"""
+    env = combined['envelope'][key]
+    values = np.where(np.abs(env['max']) >= np.abs(env['min']), env['max'], env['min'])
+    by = np.where(np.abs(env['max']) >= np.abs(env['min']), env['max_by'], env['min_by'])
+    i = np.argmax(np.abs(values))
+    return combined['combinations'][by[i]], combined['x'][i], values[i]
+
+def _envelope(values):
+    """Omhullende over de combinaties (as 0) met de maatgevende index"""
+    i_max = values.argmax(axis=0)
+    i_min = values.argmin(axis=0)
+    return {
+        'max': values.max(axis=0),
+        'min': values.min(axis=0),
+        'max_by': i_max,
+        'min_by': i_min,
+    }
@@ -0,0 +1,112 @@
+import numpy as np
+
+from influence_lines import influence_lines
+
+def moving_load_envelope(beam_length, supports, EI, axle_loads, spacings=(),
+                         step=None, n_steps=1000, x=None, chunk_size=2000):
+    """Omhullenden van V, M, y en reacties voor een rijdende lastentrein
+
+    axle_loads: asdrukken (N, omlaag positief), de voorste as eerst.
+    spacings: afstanden (mm) tussen opeenvolgende assen.
+    De trein rijdt van links naar rechts; de voorste as loopt van het begin
+    van het rooster tot de laatste as de ligger verlaten heeft, in stappen
+    van `step` mm of in `n_steps` gelijke stappen.
+
+    Alle standen worden via de gecachte invloedslijnen als één
+    matrixproduct geëvalueerd (in blokken van `chunk_size` standen).
+    Assen tussen twee roosterknopen worden lineair over de buren verdeeld
+    (zie InfluenceLines.load_vector): alleen standen met alle assen op
+    knopen zijn exact, daartussen is de omhullende een benadering die
+    met een fijner rooster (x) nauwkeuriger wordt.
+    Geeft per grootheid {'max', 'min', 'max_at', 'min_at'}, waarbij *_at
+    de maatgevende positie van de voorste as is.
+    """
+    axle_loads = np.asarray(axle_loads, dtype=float)
+    offsets = np.concatenate([[0.0], np.cumsum(np.asarray(spacings, dtype=float))])
+    if len(offsets) != len(axle_loads):
+        raise ValueError("Aantal asafstanden moet één minder zijn dan het aantal assen")
+    if np.any(offsets[1:] < offsets[:-1]):
+        raise ValueError("Asafstanden mogen niet negatief zijn")
+
+    # Alleen puntlastrijen: een asdruk is altijd een puntlast
+    il = influence_lines(beam_length, supports, EI, x=x, moments=False)
+    grid = il.x
+    n = il.n_nodes
+
+    start, end = grid[0], grid[-1] + offsets[-1]
+    if step is not None:
+        positions = np.arange(start, end + 0.5*step, step)
+    else:
+        positions = np.linspace(start, end, n_steps)
+
+    quantities = {
+        'V': il.V,
+        'M': il.M,
+        'y': il.y,
+        'theta': il.theta,
+    }
+    reactions = il.reactions
+
+    envelopes = {name: _empty_envelope(n) for name in quantities}
+    reaction_env = _empty_envelope(len(il.reaction_keys))
+
+    for lo in range(0, len(positions), chunk_size):
+        lead = positions[lo:lo + chunk_size]
+        F = _axle_matrix(grid, lead, offsets, axle_loads)
+        for name, G in quantities.items():
+            _update_envelope(envelopes[name], F @ G, lead)
+        _update_envelope(reaction_env, F @ reactions, lead)
+
+    result = {'x': grid, 'positions': positions}
+    result.update(envelopes)
+    result['reactions'] = {
+        key: {k: v[i] for k, v in reaction_env.items()}
+        for i, key in enumerate(il.reaction_keys)
+    }
+    return result
+
+def _axle_matrix(grid, lead, offsets, axle_loads):
+    """Knooplasten (n_standen × n_punten) voor alle treinstanden
+
+    Elke as wordt lineair over de twee omliggende knopen verdeeld; assen
+    buiten het rooster tellen niet mee.
+    """
+    n = len(grid)
+    pos = lead[:, None] - offsets[None, :]
+    P = np.broadcast_to(axle_loads, pos.shape)
+    on_beam = (pos >= grid[0]) & (pos <= grid[-1])
+
+    j = np.clip(np.searchsorted(grid, pos, side="right") - 1, 0, n - 2)
+    h = grid[j + 1] - grid[j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(h > 0, (pos - grid[j]) / h, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+
+    rows = np.broadcast_to(np.arange(len(lead))[:, None], pos.shape)
+    F = np.zeros((len(lead), n))
+    np.add.at(F, (rows[on_beam], j[on_beam]), (P * (1 - t))[on_beam])
+    np.add.at(F, (rows[on_beam], j[on_beam] + 1), (P * t)[on_beam])
+    return F
+
+def _empty_envelope(size):
+    return {
+        'max': np.full(size, -np.inf),
+        'min': np.full(size, np.inf),
+        'max_at': np.full(size, np.nan),
+        'min_at': np.full(size, np.nan),
+    }
+
+def _update_envelope(env, values, lead):
+    """Werk de omhullende bij met een blok standen (n_standen × size)"""
+    i_max = values.argmax(axis=0)
+    i_min = values.argmin(axis=0)
+    cols = np.arange(values.shape[1])
+    v_max = values[i_max, cols]
+    v_min = values[i_min, cols]
+
+    better = v_max > env['max']
+    env['max'][better] = v_max[better]
+    env['max_at'][better] = lead[i_max[better]]
+    better = v_min < env['min']
+    env['min'][better] = v_min[better]
+    env['min_at'][better] = lead[i_min[better]]
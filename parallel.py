@@ -0,0 +1,228 @@
+"""Parallel rekenen over processen, met resultaten via gedeeld geheugen
+
+Het hoofdproces reserveert het gedeelde geheugen; workers schrijven hun
+arrays daar direct in en sturen alleen kleine samenvattingen terug, zodat
+grote arrays niet gepickled hoeven te worden.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from beam_batch import ARRAY_KEYS, solve_beam_safe
+from beam_solver import SEGMENT_NODES, BeamSolver, adaptive_grid
+
+QUANTITIES = ('V', 'M', 'theta', 'y')
+
+def _default_workers(workers):
+    if workers:
+        return workers
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def reaction_keys(supports):
+    """Reactiesleutels in dezelfde volgorde als BeamSolver.solve_batch"""
+    keys = []
+    for pos, type in sorted(supports, key=lambda s: s[0]):
+        keys.append(pos)
+        if type.lower() == "inklemming":
+            keys.append(f"M_{pos}")
+    return keys
+
+def solve_load_cases_parallel(beam_length, supports, EI, load_cases, x=None, n_points=200,
+                              workers=None, chunk_size=None):
+    """BeamSolver.solve_batch verdeeld over processen, zelfde uitvoer
+
+    Alle gevallen delen één rooster; elke worker lost een blok gevallen
+    op en schrijft V, M, theta, y en de reacties in zijn rijen van een
+    gedeelde array (n_gevallen × n_punten).
+    """
+    load_cases = [list(case) for case in load_cases]
+    workers = _default_workers(workers)
+    if x is None:
+        x = adaptive_grid(beam_length, supports, [load for case in load_cases for load in case], n_points)
+    x = np.asarray(x, dtype=float)
+    keys = reaction_keys(supports)
+    n_cases, n_x = len(load_cases), len(x)
+    chunk_size = chunk_size or max(1, -(-n_cases // (4 * workers)))
+
+    shape = (n_cases, n_x, len(keys))
+    shm = shared_memory.SharedMemory(create=True, size=max(_case_buffer_size(*shape), 1))
+    try:
+        tasks = [(shm.name, shape, start, beam_length, supports, EI, x, load_cases[start:start + chunk_size])
+                 for start in range(0, n_cases, chunk_size)]
+        with ProcessPoolExecutor(workers) as pool:
+            for _ in pool.map(_solve_case_chunk, tasks):
+                pass
+        views = _case_views(shm.buf, *shape)
+        results = {q: views[q].copy() for q in QUANTITIES}
+        reactions = views['reactions'].copy()
+        del views
+    finally:
+        shm.close()
+        shm.unlink()
+
+    results['x'] = x
+    results['reactions'] = {key: reactions[:, i] for i, key in enumerate(keys)}
+    return results
+
+def _case_buffer_size(n_cases, n_x, n_keys):
+    return 8 * (len(QUANTITIES) * n_cases * n_x + n_cases * n_keys)
+
+def _case_views(buf, n_cases, n_x, n_keys):
+    """NumPy-views op het gedeelde geheugen voor de gevallen"""
+    block = n_cases * n_x
+    views = {q: np.ndarray((n_cases, n_x), dtype=np.float64, buffer=buf, offset=8 * i * block)
+             for i, q in enumerate(QUANTITIES)}
+    views['reactions'] = np.ndarray((n_cases, n_keys), dtype=np.float64, buffer=buf,
+                                    offset=8 * len(QUANTITIES) * block)
+    return views
+
+def _solve_case_chunk(task):
+    name, shape, start, beam_length, supports, EI, x, cases = task
+    result = BeamSolver(beam_length, supports, [], EI, x=x).solve_batch(cases)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        views = _case_views(shm.buf, *shape)
+        stop = start + len(cases)
+        for q in QUANTITIES:
+            views[q][start:stop] = result[q]
+        for i, key in enumerate(reaction_keys(supports)):
+            views['reactions'][start:stop, i] = result['reactions'][key]
+        del views
+    finally:
+        shm.close()
+
+def solve_beams_parallel(beams, workers=None, chunk_size=32, arrays=False):
+    """Los losse liggers (beam_batch-definities) parallel op, in invoervolgorde
+
+    Generator: de invoer wordt in blokken van chunk_size gelezen met
+    hooguit 2 × workers blokken tegelijk onderweg, zodat het geheugen
+    begrensd blijft. Met arrays=True schrijven de workers x, V, M, theta
+    en y in een gedeeld blok per chunk. Stopt de afnemer eerder (of gaat
+    er iets mis), dan worden de openstaande blokken geannuleerd en hun
+    gedeelde geheugen vrijgegeven.
+    """
+    workers = _default_workers(workers)
+    beams = iter(beams)
+    pending = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        try:
+            while True:
+                while len(pending) < 2 * workers:
+                    chunk = list(islice(beams, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(_submit_beam_chunk(pool, chunk, arrays))
+                if not pending:
+                    return
+                yield from _collect_beam_chunk(*pending.popleft())
+        finally:
+            while pending:
+                _discard_beam_chunk(*pending.popleft())
+
+def map_chunks_parallel(func, items, workers=None, chunk_size=8):
+    """func(blok) over processen voor een stroom items, in invoervolgorde
+
+    func krijgt een lijst van hooguit chunk_size items en geeft een lijst
+    resultaten terug; func moet op moduleniveau staan (pickle). Net als
+    bij solve_beams_parallel zijn hooguit 2 × workers blokken onderweg.
+    """
+    workers = _default_workers(workers)
+    items = iter(items)
+    pending = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        try:
+            while True:
+                while len(pending) < 2 * workers:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(func, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+def _array_bound(beam):
+    """Bovengrens voor de roosterlengte van adaptive_grid voor deze ligger
+
+    Is het rooster toch groter, dan gaan de arrays gepickled terug.
+    """
+    try:
+        n_points = int(beam.get('n_points', 200))
+        n_breaks = 2 + len(beam.get('supports', ())) + 2 * len(beam.get('loads', ()))
+        return max(n_points, 2) + 2 + n_breaks * (SEGMENT_NODES + 1)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+def _submit_beam_chunk(pool, chunk, arrays):
+    shm = None
+    offsets = bounds = None
+    if arrays:
+        bounds = [_array_bound(beam) for beam in chunk]
+        offsets = np.concatenate([[0], np.cumsum([len(ARRAY_KEYS) * b for b in bounds])]).tolist()
+        shm = shared_memory.SharedMemory(create=True, size=max(8 * offsets[-1], 1))
+    task = (None if shm is None else shm.name, offsets, bounds, chunk, arrays)
+    try:
+        return pool.submit(_solve_beam_chunk, task), shm, offsets, bounds
+    except BaseException:
+        _release(shm)
+        raise
+
+def _release(shm):
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+def _discard_beam_chunk(future, shm, offsets, bounds):
+    """Annuleer een niet-opgehaald blok en geef het gedeelde geheugen vrij
+
+    Een blok dat al loopt wordt eerst afgewacht, zodat de worker niet in
+    vrijgegeven geheugen schrijft.
+    """
+    if not future.cancel():
+        future.exception()
+    _release(shm)
+
+def _collect_beam_chunk(future, shm, offsets, bounds):
+    try:
+        results = future.result()
+        for i, result in enumerate(results):
+            n = result.pop('_n', None)
+            if n is not None:
+                block = np.ndarray((len(ARRAY_KEYS), bounds[i]), dtype=np.float64,
+                                   buffer=shm.buf, offset=8 * offsets[i])
+                for k, key in enumerate(ARRAY_KEYS):
+                    result[key] = block[k, :n].copy()
+                del block
+        return results
+    finally:
+        _release(shm)
+
+def _solve_beam_chunk(task):
+    name, offsets, bounds, beams, arrays = task
+    shm = shared_memory.SharedMemory(name=name) if name else None
+    results = []
+    try:
+        for i, beam in enumerate(beams):
+            result = solve_beam_safe(beam, arrays)
+            n = len(result['x']) if 'x' in result else 0
+            if shm is not None and 0 < n <= bounds[i]:
+                block = np.ndarray((len(ARRAY_KEYS), bounds[i]), dtype=np.float64,
+                                   buffer=shm.buf, offset=8 * offsets[i])
+                for k, key in enumerate(ARRAY_KEYS):
+                    block[k, :n] = result.pop(key)
+                del block
+                result['_n'] = n
+            results.append(result)
+    finally:
+        if shm is not None:
+            shm.close()
+    return results
@@ -0,0 +1,128 @@
+import numpy as np
+
+class PiecewisePolynomial:
+    """Stuksgewijs polynoom tussen breekpunten, opgeslagen als coëfficiënten
+
+    Segment i loopt van breaks[i] tot breaks[i+1] en is
+    p_i(t) = sum_k coeffs[i, k] * t**k met lokale coördinaat
+    t = (x - breaks[i]) / (breaks[i+1] - breaks[i]) in [0, 1].
+    Op een breekpunt geldt de waarde van het segment rechts ervan, op het
+    laatste breekpunt de limiet van binnenuit.
+    """
+
+    def __init__(self, breaks, coeffs):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coeffs = np.atleast_2d(np.asarray(coeffs, dtype=float))
+        if len(self.breaks) != len(self.coeffs) + 1:
+            raise ValueError("Aantal breekpunten moet één meer zijn dan het aantal segmenten")
+
+    @property
+    def h(self):
+        return np.diff(self.breaks)
+
+    @property
+    def degree(self):
+        return self.coeffs.shape[1] - 1
+
+    @property
+    def nbytes(self):
+        return self.breaks.nbytes + self.coeffs.nbytes
+
+    def __call__(self, x):
+        """Evalueer in willekeurige punten (Horner per segment)"""
+        x = np.asarray(x, dtype=float)
+        i = self.segment_index(x)
+        t = (x - self.breaks[i]) / self.h[i]
+        c = self.coeffs[i]
+        result = np.zeros_like(t)
+        for k in range(self.coeffs.shape[1] - 1, -1, -1):
+            result = result * t + c[..., k]
+        return result
+
+    def segment_index(self, x):
+        """Segment waarin x ligt (rechts-continu, begrensd tot de randen)"""
+        i = np.searchsorted(self.breaks, x, side="right") - 1
+        return np.clip(i, 0, len(self.coeffs) - 1)
+
+    def derivative(self):
+        """Afgeleide naar x"""
+        k = np.arange(1, self.coeffs.shape[1])
+        if len(k) == 0:
+            return PiecewisePolynomial(self.breaks, np.zeros((len(self.coeffs), 1)))
+        coeffs = self.coeffs[:, 1:] * k / self.h[:, None]
+        return PiecewisePolynomial(self.breaks, coeffs)
+
+    def antiderivative(self, initial=0.0):
+        """Continue primitieve naar x met waarde `initial` in breaks[0]"""
+        k = np.arange(1, self.coeffs.shape[1] + 1)
+        coeffs = np.zeros((len(self.coeffs), self.coeffs.shape[1] + 1))
+        coeffs[:, 1:] = self.coeffs / k * self.h[:, None]
+
+        # Beginwaarde per segment: som van de integralen van de vorige segmenten
+        totals = coeffs[:, 1:].sum(axis=1)
+        coeffs[:, 0] = initial + np.concatenate([[0.0], np.cumsum(totals[:-1])])
+        return PiecewisePolynomial(self.breaks, coeffs)
+
+    def integrate(self, a=None, b=None):
+        """Bepaalde integraal van a tot b (standaard over het hele domein)"""
+        a = self.breaks[0] if a is None else a
+        b = self.breaks[-1] if b is None else b
+        F = self.antiderivative()
+        return F(b) - F(a)
+
+    def scaled(self, factor):
+        """Polynoom vermenigvuldigd met een constante"""
+        return PiecewisePolynomial(self.breaks, self.coeffs * factor)
+
+    def plus_linear(self, a, b=0.0):
+        """Polynoom plus a + b*x"""
+        order = max(self.coeffs.shape[1], 2)
+        coeffs = np.zeros((len(self.coeffs), order))
+        coeffs[:, :self.coeffs.shape[1]] = self.coeffs
+        coeffs[:, 0] += a + b * self.breaks[:-1]
+        coeffs[:, 1] += b * self.h
+        return PiecewisePolynomial(self.breaks, coeffs)
+
+    def restrict(self, a, b):
+        """Deel tussen de breekpunten a en b (segmenten die binnen [a, b] liggen)"""
+        keep = (self.breaks[:-1] >= a) & (self.breaks[1:] <= b)
+        if not keep.any():
+            raise ValueError("Geen segmenten binnen het gevraagde bereik")
+        i = np.flatnonzero(keep)
+        return PiecewisePolynomial(self.breaks[i[0]:i[-1] + 2], self.coeffs[i[0]:i[-1] + 1])
+
+    def end_values(self):
+        """Waarden aan begin en eind van elk segment (linker- en rechterlimieten)"""
+        return self.coeffs[:, 0].copy(), self.coeffs.sum(axis=1)
+
+    def roots(self, value=0.0):
+        """Alle reële x waar het polynoom gelijk is aan `value`
+
+        Segmenten worden gegroepeerd op hun werkelijke graad; per groep
+        volgen de nulpunten uit de eigenwaarden van de gestapelde
+        companion-matrices (één NumPy-aanroep per graad).
+        """
+        c = self.coeffs.copy()
+        c[:, 0] -= value
+        scale = np.abs(c).max(axis=1, keepdims=True)
+        significant = np.abs(c) > 1e-14 * np.maximum(scale, 1e-300)
+        degree = np.where(significant.any(axis=1),
+                          c.shape[1] - 1 - np.argmax(significant[:, ::-1], axis=1), 0)
+
+        found = []
+        for d in np.unique(degree[degree > 0]):
+            rows = np.flatnonzero(degree == d)
+            lead = c[rows, d]
+            if d == 1:
+                t = (-c[rows, 0] / lead)[:, None]
+            else:
+                companion = np.zeros((len(rows), d, d))
+                companion[:, 1:, :-1] = np.eye(d - 1)
+                companion[:, :, -1] = -c[rows, :d] / lead[:, None]
+                t = np.linalg.eigvals(companion)
+            real = np.abs(t.imag) < 1e-9
+            t = t.real
+            inside = real & (t >= 0.0) & (t <= 1.0)
+            seg = np.broadcast_to(rows[:, None], t.shape)[inside]
+            found.append(self.breaks[seg] + t[inside] * self.h[seg])
+        return np.unique(np.concatenate(found)) if found else np.array([])
@@ -0,0 +1,54 @@
+from beam_solver import BeamSolver
+from extrema import extremum
+from profiles import section_catalogue
+
+def deflection_spans(beam_length, supports):
+    """Velden voor de doorbuigingseis: (begin, eind, referentielengte)
+
+    Een veld tussen twee steunpunten gebruikt zijn eigen lengte, een
+    uitkraging twee keer de uitkraaglengte.
+    """
+    positions = sorted(pos for pos, _ in supports)
+    spans = []
+    if positions[0] > 0:
+        spans.append((0.0, positions[0], 2 * positions[0]))
+    for a, b in zip(positions[:-1], positions[1:]):
+        if b > a:
+            spans.append((a, b, b - a))
+    if positions[-1] < beam_length:
+        spans.append((positions[-1], beam_length, 2 * (beam_length - positions[-1])))
+    return spans
+
+def required_section(beam_length, supports, loads, E=210000.0, deflection_ratio=250, stress_limit=235.0):
+    """Minimaal benodigde I (mm⁴) en W (mm³) uit één berekening met EI = 1
+
+    M en de reacties hangen bij een prismatische ligger niet van EI af en
+    de doorbuiging schaalt met 1/EI, dus per profiel is geen nieuwe
+    berekening nodig: een profiel voldoet als I >= I_req en W >= W_req.
+    """
+    unit = BeamSolver(beam_length, supports, loads, 1.0).solve_piecewise()
+    M_max = abs(extremum(unit['M'])[0])
+
+    I_req = 0.0
+    for a, b, length in deflection_spans(beam_length, supports):
+        y_unit = abs(extremum(unit['y'].restrict(a, b))[0])
+        I_req = max(I_req, y_unit / (E * length / deflection_ratio))
+
+    return {'I': I_req, 'W': M_max / stress_limit, 'M_max': M_max}
+
+def optimize_profile(beam_length, supports, loads, E=210000.0, deflection_ratio=250,
+                     stress_limit=235.0, categories=None):
+    """Lichtste standaardprofiel dat aan doorbuiging (L/ratio) en spanning voldoet
+
+    Geeft een dict met categorie, naam, I, A, W, massa (kg/m), optredende
+    spanning en de benutting, of None als geen profiel uit de tabellen
+    voldoet.
+    """
+    req = required_section(beam_length, supports, loads, E, deflection_ratio, stress_limit)
+    i = section_catalogue().lightest(req['I'], req['W'], categories)
+    if i is None:
+        return None
+    best = section_catalogue().row(i)
+    best['stress'] = req['M_max'] / best['W']
+    best['utilization'] = max(req['I'] / best['I'], req['W'] / best['W'])
+    return best
@@ -0,0 +1,216 @@
+"""Standaardprofielen en doorsnede-eigenschappen, zonder Streamlit-afhankelijkheid"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from errors import SectionError
+
+# Profiel bibliotheken
+# HEA profielen (h, b, tw, tf)
+HEA_PROFILES = {
+    "HEA 100": (96, 100, 5.0, 8.0),
+    "HEA 120": (114, 120, 5.0, 8.0),
+    "HEA 140": (133, 140, 5.5, 8.5),
+    "HEA 160": (152, 160, 6.0, 9.0),
+    "HEA 180": (171, 180, 6.0, 9.5),
+    "HEA 200": (190, 200, 6.5, 10.0),
+    "HEA 220": (210, 220, 7.0, 11.0),
+    "HEA 240": (230, 240, 7.5, 12.0),
+    "HEA 260": (250, 260, 7.5, 12.5),
+    "HEA 280": (270, 280, 8.0, 13.0),
+    "HEA 300": (290, 300, 8.5, 14.0),
+}
+
+# HEB profielen (h, b, tw, tf)
+HEB_PROFILES = {
+    "HEB 100": (100, 100, 6.0, 10.0),
+    "HEB 120": (120, 120, 6.5, 11.0),
+    "HEB 140": (140, 140, 7.0, 12.0),
+    "HEB 160": (160, 160, 8.0, 13.0),
+    "HEB 180": (180, 180, 8.5, 14.0),
+    "HEB 200": (200, 200, 9.0, 15.0),
+    "HEB 220": (220, 220, 9.5, 16.0),
+    "HEB 240": (240, 240, 10.0, 17.0),
+    "HEB 260": (260, 260, 10.0, 17.5),
+    "HEB 280": (280, 280, 10.5, 18.0),
+    "HEB 300": (300, 300, 11.0, 19.0),
+}
+
+# IPE profielen (h, b, tw, tf)
+IPE_PROFILES = {
+    "IPE 80": (80, 46, 3.8, 5.2),
+    "IPE 100": (100, 55, 4.1, 5.7),
+    "IPE 120": (120, 64, 4.4, 6.3),
+    "IPE 140": (140, 73, 4.7, 6.9),
+    "IPE 160": (160, 82, 5.0, 7.4),
+    "IPE 180": (180, 91, 5.3, 8.0),
+    "IPE 200": (200, 100, 5.6, 8.5),
+    "IPE 220": (220, 110, 5.9, 9.2),
+    "IPE 240": (240, 120, 6.2, 9.8),
+    "IPE 270": (270, 135, 6.6, 10.2),
+    "IPE 300": (300, 150, 7.1, 10.7),
+}
+
+# UNP profielen (h, b, tw, tf)
+UNP_PROFILES = {
+    "UNP 80": (80, 45, 6.0, 8.0),
+    "UNP 100": (100, 50, 6.0, 8.5),
+    "UNP 120": (120, 55, 7.0, 9.0),
+    "UNP 140": (140, 60, 7.0, 10.0),
+    "UNP 160": (160, 65, 7.5, 10.5),
+    "UNP 180": (180, 70, 8.0, 11.0),
+    "UNP 200": (200, 75, 8.5, 11.5),
+    "UNP 220": (220, 80, 9.0, 12.5),
+    "UNP 240": (240, 85, 9.5, 13.0),
+}
+
+# Koker profielen (h, b, t)
+KOKER_PROFILES = {
+    "Koker 40x40x3": (40, 40, 3.0),
+    "Koker 50x50x3": (50, 50, 3.0),
+    "Koker 60x60x3": (60, 60, 3.0),
+    "Koker 60x60x4": (60, 60, 4.0),
+    "Koker 70x70x3": (70, 70, 3.0),
+    "Koker 70x70x4": (70, 70, 4.0),
+    "Koker 80x80x3": (80, 80, 3.0),
+    "Koker 80x80x4": (80, 80, 4.0),
+    "Koker 80x80x5": (80, 80, 5.0),
+    "Koker 90x90x3": (90, 90, 3.0),
+    "Koker 90x90x4": (90, 90, 4.0),
+}
+
+# Tabellen per categorie en het bijbehorende profieltype voor de formules
+PROFILE_TABLES = {
+    "HEA": HEA_PROFILES,
+    "HEB": HEB_PROFILES,
+    "IPE": IPE_PROFILES,
+    "UNP": UNP_PROFILES,
+    "Koker": KOKER_PROFILES,
+}
+PROFILE_TYPES = {"HEA": "I-profiel", "HEB": "I-profiel", "IPE": "I-profiel", "UNP": "U-profiel", "Koker": "Koker"}
+
+# Staal: 7850 kg/m³ = 7.85e-6 kg/mm³
+STEEL_DENSITY = 7.85e-6
+
+def get_profile_list(category):
+    """Profielnamen van een categorie, van klein naar groot"""
+    return list(PROFILE_TABLES[category])
+
+def get_profile_dimensions(category, name):
+    """(hoogte, breedte, wanddikte, flensdikte) van een standaardprofiel
+
+    Kokers hebben geen aparte flensdikte (None).
+    """
+    dims = PROFILE_TABLES[category][name]
+    if len(dims) == 3:
+        return dims[0], dims[1], dims[2], None
+    return dims
+
+def moment_of_inertia(profile_type, h, b, t_w, t_f=None):
+    """Traagheidsmoment om de sterke as (mm⁴); SectionError bij ongeldige invoer"""
+    # Controleer invoer
+    if h <= 0 or b <= 0 or t_w <= 0:
+        raise SectionError("Profielafmetingen moeten positief zijn")
+
+    if t_w >= min(h, b)/2:
+        raise SectionError("Wanddikte te groot voor profiel")
+
+    # Controleer of profile_type een string is
+    if not isinstance(profile_type, str):
+        raise SectionError(f"Ongeldig profieltype: {profile_type} (type: {type(profile_type)})")
+
+    if profile_type.lower() == "koker":
+        # Koker: I = (BH³ - bh³)/12
+        h_i = h - 2*t_w  # Inwendige hoogte
+        b_i = b - 2*t_w  # Inwendige breedte
+        if h_i <= 0 or b_i <= 0:
+            raise SectionError("Wanddikte te groot voor profiel")
+        return (b*h**3 - b_i*h_i**3)/12
+
+    if profile_type.lower() in ["i-profiel", "u-profiel"]:
+        if t_f is None or t_f <= 0:
+            raise SectionError("Flensdikte moet positief zijn")
+        if t_f >= h/2:
+            raise SectionError("Flensdikte te groot voor profiel")
+
+        # I-profiel: lijf plus twee flenzen (Steiner)
+        hw = h - 2*t_f  # Lijfhoogte
+        I_web = t_w * hw**3 / 12
+        I_flange = b * t_f**3 / 12 + b*t_f * (h-t_f)**2 / 4
+        return I_web + 2*I_flange
+
+    raise SectionError("Ongeldig profieltype")
+
+def section_area(profile_type, h, b, t_w, t_f=None):
+    """Oppervlakte van de doorsnede (mm²), 0 voor onbekende typen"""
+    if profile_type.lower() == "koker":
+        return (h * b) - ((h - 2*t_w) * (b - 2*t_w))
+    elif profile_type.lower() in ["i-profiel", "u-profiel"]:
+        # Flenzen plus lijf
+        return 2 * (b * t_f) + t_w * (h - 2*t_f)
+    return 0
+
+class SectionCatalogue:
+    """Array-gebaseerde catalogus van alle standaardprofielen
+
+    Eigenschappen (I, A, W, massa per meter en afmetingen) worden één keer
+    per profiel met moment_of_inertia en section_area berekend en als
+    NumPy-arrays bewaard, zodat selecties op de hele catalogus in één
+    vectorbewerking gaan.
+    """
+
+    def __init__(self, tables=None):
+        tables = PROFILE_TABLES if tables is None else tables
+        rows = [(category, name, *get_profile_dimensions(category, name))
+                for category, table in tables.items() for name in table]
+        self.category = np.array([r[0] for r in rows])
+        self.name = np.array([r[1] for r in rows])
+        self.h, self.b, self.t_w = (np.array([r[k] for r in rows], dtype=float) for k in (2, 3, 4))
+        self.t_f = np.array([np.nan if r[5] is None else r[5] for r in rows], dtype=float)
+
+        # Eén bron van waarheid: de scalaire formules per profiel
+        types = [PROFILE_TYPES.get(r[0]) or ("Koker" if r[5] is None else "I-profiel") for r in rows]
+        self.I = np.array([moment_of_inertia(t, *r[2:]) for t, r in zip(types, rows)])
+        self.A = np.array([section_area(t, *r[2:]) for t, r in zip(types, rows)], dtype=float)
+        self.W = self.I / (self.h/2)
+        self.mass = self.A * STEEL_DENSITY * 1000  # kg/m
+
+    def __len__(self):
+        return len(self.name)
+
+    def query(self, I_min=0.0, W_min=0.0, A_min=0.0, categories=None, sort_by="mass"):
+        """Indices van alle profielen die aan de minima voldoen, gesorteerd"""
+        ok = (self.I >= I_min) & (self.W >= W_min) & (self.A >= A_min)
+        if categories is not None:
+            ok &= np.isin(self.category, list(categories))
+        idx = np.flatnonzero(ok)
+        return idx[np.argsort(getattr(self, sort_by)[idx], kind="stable")]
+
+    def lightest(self, I_min=0.0, W_min=0.0, categories=None):
+        """Index van het lichtste profiel dat voldoet, of None"""
+        idx = self.query(I_min, W_min, categories=categories)
+        return int(idx[0]) if len(idx) else None
+
+    def index(self, name):
+        """Index van een profiel op naam ("HEA 200"); SectionError als het ontbreekt"""
+        match = np.flatnonzero(self.name == name)
+        if len(match) == 0:
+            raise SectionError(f"Onbekend profiel: {name}")
+        return int(match[0])
+
+    def row(self, i):
+        """Eigenschappen van profiel i als dict"""
+        return {
+            'category': str(self.category[i]),
+            'name': str(self.name[i]),
+            'I': float(self.I[i]),
+            'A': float(self.A[i]),
+            'W': float(self.W[i]),
+            'mass': float(self.mass[i]),
+        }
+
+@lru_cache(maxsize=1)
+def section_catalogue():
+    """Gedeelde catalogus van de standaardtabellen (één keer opgebouwd)"""
+    return SectionCatalogue()
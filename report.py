@@ -0,0 +1,480 @@
+"""PDF-rapport met vectorgrafieken, rechtstreeks in ReportLab
+
+Gebruik voor een rapportbundel van veel liggers (beam_batch-invoer):
+    python report.py liggers.jsonl -o bundel.pdf
+    python report.py liggers.csv -o bundel.zip --workers 4
+
+De V/M/theta/y-diagrammen worden als ReportLab-tekening (lijnen en
+polygonen) uit de resultaatarrays opgebouwd; er is geen kaleido of
+headless browser nodig.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import count, tee
+
+import numpy as np
+from reportlab.graphics.shapes import Drawing, Line, PolyLine, Polygon, Rect, String
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+
+from analysis import result_extremes
+from beam_batch import ARRAY_KEYS, beam_stiffness, read_beams, solve_beam_safe
+from decimation import minmax_decimate
+from profiles import section_area, section_catalogue
+
+# (sleutel, titel, schaalfactor naar weergave-eenheid, kleur)
+DIAGRAMS = (
+    ('y', "Doorbuiging [mm]", 1.0, '#3498db'),
+    ('V', "Dwarskracht [kN]", 1e-3, '#2ecc71'),
+    ('M', "Moment [kNm]", 1e-6, '#e74c3c'),
+    ('theta', "Rotatie [rad]", 1.0, '#f39c12'),
+)
+
+TEXT_COLOR = colors.HexColor('#2c3e50')
+GRID_COLOR = colors.HexColor('#dee2e6')
+HEADER_COLOR = colors.HexColor('#f8f9fa')
+
+@lru_cache(maxsize=None)
+def report_styles():
+    """Paragraaf- en tabelstijlen, één keer opgebouwd en daarna gedeeld"""
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=TEXT_COLOR
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceBefore=20,
+            spaceAfter=10,
+            textColor=colors.HexColor('#34495e')
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=TEXT_COLOR
+        ),
+        'table': _table_style((0, 0), (-1, 0)),
+        'table_column': _table_style((0, 0), (0, -1)),
+    }
+
+def _table_style(header_start, header_end):
+    """Tabelstijl van het rapport; de kopcellen krijgen een achtergrond"""
+    return TableStyle([
+        ('BACKGROUND', header_start, header_end, HEADER_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, -1), TEXT_COLOR),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, GRID_COLOR)
+    ])
+
+def result_drawing(results, width=160*mm, height=120*mm):
+    """Vier diagrammen (y, V, M, theta) onder elkaar als vectortekening
+
+    results bevat de arrays 'x', 'V', 'M', 'theta' en 'y'. De x-as loopt
+    in meters; elk paneel schaalt verticaal op zijn eigen bereik en
+    labelt het grootste absolute extreem.
+    """
+    drawing = Drawing(width, height)
+    x = np.asarray(results['x'], dtype=float) / 1000
+    x_min, x_max = x[0], x[-1]
+    span = x_max - x_min if x_max > x_min else 1.0
+
+    left, right, bottom = 30.0, 10.0, 24.0
+    panel_gap = 8.0
+    title_height = 10.0
+    plot_width = width - left - right
+    panel_height = (height - bottom) / len(DIAGRAMS) - panel_gap - title_height
+
+    for i, (key, title, scale, color) in enumerate(DIAGRAMS):
+        # Hooguit twee lijnpunten per punt (1/72 inch) tekenbreedte
+        x_line, values = minmax_decimate(x, np.asarray(results[key], dtype=float) * scale, int(plot_width))
+        px = left + (x_line - x_min) / span * plot_width
+        top = height - i * (panel_height + panel_gap + title_height)
+        base = top - title_height - panel_height
+        drawing.add(String(left, top - 8, title, fontName='Helvetica-Bold', fontSize=8, fillColor=TEXT_COLOR))
+        drawing.add(Rect(left, base, plot_width, panel_height, fillColor=None,
+                         strokeColor=GRID_COLOR, strokeWidth=0.5))
+
+        # Verticale schaal symmetrisch rond nul, zodat de nullijn altijd zichtbaar is
+        extent = float(np.max(np.abs(values))) if len(values) else 0.0
+        extent = extent if extent > 0 else 1.0
+        zero = base + panel_height / 2
+        py = zero + values / extent * (panel_height / 2) * 0.9
+
+        stroke = colors.HexColor(color)
+        fill_points = np.concatenate(([px[0], zero], np.column_stack((px, py)).ravel(), [px[-1], zero]))
+        drawing.add(Polygon(fill_points.tolist(), fillColor=stroke, fillOpacity=0.2, strokeColor=None))
+        drawing.add(Line(left, zero, left + plot_width, zero, strokeColor=colors.HexColor('#bdc3c7'), strokeWidth=0.75))
+        drawing.add(PolyLine(np.column_stack((px, py)).ravel().tolist(), strokeColor=stroke, strokeWidth=1.2))
+
+        # Grootste absolute waarde met positie
+        j = int(np.argmax(np.abs(values)))
+        label = f"{values[j]:.4f}" if key == 'theta' else f"{values[j]:.2f}"
+        anchor = 'end' if px[j] > left + 0.8 * plot_width else 'start'
+        drawing.add(String(px[j] + (-2 if anchor == 'end' else 2), py[j] + (3 if values[j] >= 0 else -8),
+                           label, fontName='Helvetica', fontSize=7, fillColor=stroke, textAnchor=anchor))
+        drawing.add(String(left - 3, zero - 2.5, "0", fontName='Helvetica', fontSize=7,
+                           fillColor=TEXT_COLOR, textAnchor='end'))
+
+    # x-as onder het laatste paneel
+    for tick in np.linspace(x_min, x_max, 6):
+        tx = left + (tick - x_min) / span * plot_width
+        drawing.add(String(tx, bottom - 11, f"{tick:.2f}", fontName='Helvetica', fontSize=7,
+                           fillColor=TEXT_COLOR, textAnchor='middle'))
+    drawing.add(String(left + plot_width / 2, 2, "Positie [m]", fontName='Helvetica', fontSize=7,
+                       fillColor=TEXT_COLOR, textAnchor='middle'))
+    return drawing
+
+def beam_report_data(beam_length, supports, loads, profile_type, height, width, wall_thickness,
+                     flange_thickness, E, I, x, V, M, theta, y):
+    """Rapportgegevens van één ligger, met exacte maxima tussen de roosterpunten"""
+    extremes = result_extremes(beam_length, supports, loads, E * I, x, V, M, theta, y)
+    section_modulus = I / (height / 2)
+    max_moment = abs(extremes['M'][0])
+    return {
+        "beam_length": beam_length,
+        "profile_type": profile_type,
+        "height": height,
+        "width": width,
+        "wall_thickness": wall_thickness,
+        "flange_thickness": flange_thickness,
+        "E": E,
+        "EI": E * I,
+        "area": section_area(profile_type, height, width, wall_thickness, flange_thickness),
+        "moment_of_inertia": I,
+        "section_modulus": section_modulus,
+        "max_stress": max_moment / section_modulus,
+        "supports": supports,
+        "loads": loads,
+        "max_deflection": abs(extremes['y'][0]),
+        "max_rotation": abs(extremes['theta'][0]),
+        "max_shear": abs(extremes['V'][0]),
+        "max_moment": max_moment,
+        "extreme_positions": {key: float(at) for key, (_, at) in extremes.items()},
+    }
+
+def report_elements(beam_data, results, title="BeamSolve Pro", generated=None):
+    """Flowables voor het rapport van één ligger
+
+    generated is het tijdstip in de kop (datetime), standaard nu.
+    """
+    styles = report_styles()
+    heading_style = styles['heading']
+    elements = []
+
+    # Header met titel
+    elements.append(Paragraph(title, styles['title']))
+    generated = generated or datetime.now()
+    elements.append(Paragraph(f"Rapport gegenereerd op {generated.strftime('%d-%m-%Y %H:%M')}", styles['body']))
+    elements.append(Spacer(1, 20))
+
+    # Profiel informatie (batchliggers kunnen alleen EI hebben)
+    section = count(1)
+    if beam_data.get("height") is not None:
+        elements.append(Paragraph(f"{next(section)}. Profiel Specificaties", heading_style))
+        profile_data = [
+            ["Type", beam_data["profile_type"]],
+            ["Hoogte", f"{beam_data['height']} mm"],
+            ["Breedte", f"{beam_data['width']} mm"],
+            ["Wanddikte", f"{beam_data['wall_thickness']} mm"]
+        ]
+        if beam_data.get("flange_thickness"):
+            profile_data.append(["Flensdikte", f"{beam_data['flange_thickness']} mm"])
+    else:
+        elements.append(Paragraph(f"{next(section)}. Ligger", heading_style))
+        profile_data = [["Lengte", f"{beam_data['beam_length']:.0f} mm"],
+                        ["Buigstijfheid EI", f"{beam_data['EI']:.4g} N·mm²"]]
+    elements.append(Table(profile_data, colWidths=[100, 200], style=styles['table_column']))
+    elements.append(Spacer(1, 20))
+
+    # Profiel eigenschappen
+    if beam_data.get("section_modulus") is not None:
+        elements.append(Paragraph(f"{next(section)}. Profiel Eigenschappen", heading_style))
+        properties_data = [
+            ["Parameter", "Waarde", "Eenheid"],
+            ["Oppervlakte", f"{beam_data['area']:.0f}", "mm²"],
+            ["Traagheidsmoment", f"{beam_data['moment_of_inertia']:.0f}", "mm⁴"],
+            ["Weerstandsmoment", f"{beam_data['section_modulus']:.0f}", "mm³"],
+            ["Max. buigspanning", f"{beam_data['max_stress']:.1f}", "N/mm²"]
+        ]
+        elements.append(Table(properties_data, colWidths=[100, 100, 100], style=styles['table']))
+        elements.append(Spacer(1, 20))
+
+    # Steunpunten
+    elements.append(Paragraph(f"{next(section)}. Steunpunten", heading_style))
+    support_data = [["#", "Type", "Positie"]]
+    for i, (pos, type) in enumerate(beam_data['supports'], 1):
+        support_data.append([str(i), type, f"{pos:g} mm"])
+    elements.append(Table(support_data, colWidths=[50, 150, 100], style=styles['table']))
+    elements.append(Spacer(1, 20))
+
+    # Belastingen
+    elements.append(Paragraph(f"{next(section)}. Belastingen", heading_style))
+    load_data = [["#", "Type", "Waarde", "Positie", "Lengte"]]
+    for i, load in enumerate(beam_data['loads'], 1):
+        if len(load) == 5:  # Trapeziumlast
+            pos, val, type, length, val_end = load
+            load_data.append([str(i), type, f"{val/1000:.1f}–{val_end/1000:.1f} kN/m", f"{pos:g} mm", f"{length:g} mm"])
+        elif len(load) == 4:  # Verdeelde of driehoekslast
+            pos, val, type, length = load
+            load_data.append([str(i), type, f"{val/1000:.1f} kN/m", f"{pos:g} mm", f"{length:g} mm"])
+        else:  # Puntlast of moment
+            pos, val, type = load
+            if type == "Moment":
+                load_data.append([str(i), type, f"{val/1e6:.1f} kNm", f"{pos:g} mm", "-"])
+            else:
+                load_data.append([str(i), type, f"{val/1000:.1f} kN", f"{pos:g} mm", "-"])
+    elements.append(Table(load_data, colWidths=[30, 100, 80, 80, 80], style=styles['table']))
+    elements.append(Spacer(1, 20))
+
+    # Resultaten als vectorgrafiek
+    elements.append(Paragraph(f"{next(section)}. Resultaten", heading_style))
+    elements.append(result_drawing(results))
+    elements.append(Spacer(1, 10))
+
+    # Maximale waarden
+    elements.append(Paragraph("Maximale Waarden:", heading_style))
+    at = beam_data.get("extreme_positions", {})
+    position = lambda key: f"{at[key]:.0f} mm" if key in at else "-"
+    max_data = [
+        ["Parameter", "Waarde", "Eenheid", "Positie"],
+        ["Max. Doorbuiging", f"{beam_data['max_deflection']:.2f}", "mm", position('y')],
+        ["Max. Rotatie", f"{beam_data['max_rotation']:.4f}", "rad", position('theta')],
+        ["Max. Dwarskracht", f"{beam_data['max_shear']/1000:.1f}", "kN", position('V')],
+        ["Max. Moment", f"{beam_data['max_moment']/1000000:.1f}", "kNm", position('M')]
+    ]
+    elements.append(Table(max_data, colWidths=[100, 100, 60, 80], style=styles['table']))
+
+    # Footer
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("Berekend met BeamSolve Pro 2025", styles['body']))
+    return elements
+
+def report_document(buffer):
+    """A4-documentsjabloon met de marges van het rapport"""
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=20*mm,
+        leftMargin=20*mm,
+        topMargin=20*mm,
+        bottomMargin=20*mm
+    )
+
+def generate_pdf_report(beam_data, results, generated=None):
+    """Genereer een professioneel PDF rapport
+
+    results bevat de resultaatarrays ('x', 'V', 'M', 'theta', 'y'); de
+    diagrammen worden als vectorgrafiek getekend.
+    """
+    buffer = BytesIO()
+    report_document(buffer).build(report_elements(beam_data, results, generated=generated))
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
+
+def generate_report(beam_length, supports, loads, profile_type, height, width, wall_thickness,
+                    flange_thickness, E, I, reactions, x, V, M, theta, y, generated=None):
+    """PDF-rapport (bytes) van één doorgerekende ligger, gedateerd op generated"""
+    beam_data = beam_report_data(beam_length, supports, loads, profile_type, height, width,
+                                 wall_thickness, flange_thickness, E, I, x, V, M, theta, y)
+    beam_data["reactions"] = reactions
+    results = {'x': x, 'V': V, 'M': M, 'theta': theta, 'y': y}
+    return generate_pdf_report(beam_data, results, generated)
+
+def batch_report_data(beam, summary):
+    """Rapportgegevens voor een beam_batch-definitie en zijn opgeloste samenvatting
+
+    Met een profielnaam komen de doorsnede-eigenschappen uit de catalogus;
+    met alleen EI (of E en I) blijft het profieldeel leeg.
+    """
+    max_moment = abs(summary['max_M'])
+    beam_data = {
+        "beam_length": float(beam['length']),
+        "EI": beam_stiffness(beam),
+        "supports": [(float(p), str(t)) for p, t in beam['supports']],
+        "loads": [(float(p), float(v), str(t), *map(float, rest)) for p, v, t, *rest in beam['loads']],
+        "reactions": summary['reactions'],
+        "max_deflection": abs(summary['max_y']),
+        "max_rotation": abs(summary['max_theta']),
+        "max_shear": abs(summary['max_V']),
+        "max_moment": max_moment,
+        "extreme_positions": {key: summary[f'x_{key}'] for key in ('V', 'M', 'theta', 'y')},
+    }
+    if 'profile' in beam:
+        catalogue = section_catalogue()
+        i = catalogue.index(beam['profile'])
+        t_f = catalogue.t_f[i]
+        beam_data.update({
+            "profile_type": beam['profile'],
+            "height": float(catalogue.h[i]),
+            "width": float(catalogue.b[i]),
+            "wall_thickness": float(catalogue.t_w[i]),
+            "flange_thickness": None if np.isnan(t_f) else float(t_f),
+            "area": float(catalogue.A[i]),
+            "moment_of_inertia": float(catalogue.I[i]),
+            "section_modulus": float(catalogue.W[i]),
+            "max_stress": max_moment / catalogue.W[i],
+        })
+    return beam_data
+
+def _beam_name(beam, index):
+    name = beam.get('id') if isinstance(beam, dict) else None
+    return str(name) if name is not None else f"ligger {index}"
+
+def _report_flowables(beam, summary, index, title):
+    """Flowables van één batchligger, of None met de foutmelding"""
+    if 'error' in summary:
+        return None, summary['error']
+    try:
+        results = {key: summary[key] for key in ARRAY_KEYS}
+        return report_elements(batch_report_data(beam, summary), results, f"{title} – {_beam_name(beam, index)}"), None
+    except (ValueError, KeyError, TypeError) as e:
+        return None, str(e)
+
+def bulk_report_pdf(beams, output, workers=1, title="BeamSolve Pro"):
+    """Alle liggers in één PDF, elke ligger vanaf een nieuwe pagina
+
+    Het oplossen gaat met workers > 1 over processen (parallel.py); de
+    opmaak gebeurt in één document met gedeelde stijlen. output is een
+    pad of een binaire stream. Geeft (aantal rapporten, [(ligger, fout)]).
+
+    De invoer wordt gestreamd en elke ligger wordt pas opgemaakt als
+    build() aan de beurt is, maar ReportLab houdt het hele document tot
+    het opslaan in het geheugen: het geheugen groeit dus met de grootte
+    van de PDF. Gebruik bulk_report_zip voor begrensd geheugen.
+    """
+    from reportlab.platypus import PageBreak
+
+    beams, pending = tee(beams)
+    if workers and workers > 1:
+        from parallel import solve_beams_parallel
+        summaries = solve_beams_parallel(pending, workers=workers, arrays=True)
+    else:
+        summaries = (solve_beam_safe(beam, arrays=True) for beam in pending)
+
+    errors, reported = [], count()
+    parts = _bulk_flowables(zip(beams, summaries), title, errors, reported)
+    first = next(parts, None)
+    if first is not None:
+        rest = ([PageBreak(), *flowables] for flowables in parts)
+        report_document(output).build(_FlowableStream(first, rest))
+    return next(reported), errors
+
+def _bulk_flowables(pairs, title, errors, reported):
+    """Flowables per geslaagde ligger; fouten gaan naar errors"""
+    for index, (beam, summary) in enumerate(pairs, 1):
+        flowables, error = _report_flowables(beam, summary, index, title)
+        if error is not None:
+            errors.append((_beam_name(beam, index), error))
+            continue
+        next(reported)
+        yield flowables
+
+class _FlowableStream(list):
+    """Flowables die tijdens build() per ligger worden bijgevuld
+
+    SimpleDocTemplate.build haalt de flowables vooraan weg zolang len()
+    niet 0 is; pas dan wordt de volgende ligger opgemaakt, zodat alleen
+    de flowables van de huidige ligger in het geheugen staan.
+    """
+
+    def __init__(self, first, rest):
+        super().__init__(first)
+        self._rest = rest
+
+    def __len__(self):
+        n = super().__len__()
+        while n == 0:
+            more = next(self._rest, None)
+            if more is None:
+                break
+            self.extend(more)
+            n = super().__len__()
+        return n
+
+def bulk_report_zip(beams, output, workers=1, title="BeamSolve Pro", chunk_size=8):
+    """Eén PDF per ligger in een zip-archief
+
+    De rapporten worden per blok in de workers opgelost én opgemaakt en
+    direct in het archief geschreven, zodat er steeds maar een begrensd
+    aantal PDF's in het geheugen staat.
+    """
+    import zipfile
+
+    chunks = _numbered(beams, title)
+    if workers and workers > 1:
+        from parallel import map_chunks_parallel
+        reports = map_chunks_parallel(_render_report_chunk, chunks, workers=workers, chunk_size=chunk_size)
+    else:
+        reports = (report for item in chunks for report in _render_report_chunk([item]))
+
+    count, errors = 0, []
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, pdf, error in reports:
+            if error is not None:
+                errors.append((name, error))
+                continue
+            archive.writestr(f"{name}.pdf", pdf)
+            count += 1
+    return count, errors
+
+def _numbered(beams, title):
+    for index, beam in enumerate(beams, 1):
+        yield index, beam, title
+
+def _render_report_chunk(chunk):
+    """Worker: los een blok liggers op en geef (naam, pdf, fout) per ligger"""
+    rendered = []
+    for index, beam, title in chunk:
+        name = _file_name(beam, index)
+        summary = solve_beam_safe(beam, arrays=True)
+        flowables, error = _report_flowables(beam, summary, index, title)
+        pdf = None
+        if error is None:
+            buffer = BytesIO()
+            report_document(buffer).build(flowables)
+            pdf = buffer.getvalue()
+        rendered.append((name, pdf, error))
+    return rendered
+
+def _file_name(beam, index):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in _beam_name(beam, index))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF-rapporten voor een bestand met liggers")
+    parser.add_argument("input", help="invoerbestand (.json, .jsonl, .csv, .yaml) of - voor stdin")
+    parser.add_argument("-o", "--output", required=True, help="bundel.pdf (één document) of bundel.zip (PDF per ligger)")
+    parser.add_argument("--format", choices=["json", "jsonl", "csv", "yaml"], help="invoerformaat forceren")
+    parser.add_argument("--workers", type=int, default=1, help="aantal processen (standaard 1)")
+    parser.add_argument("--title", default="BeamSolve Pro", help="titel boven elk rapport")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    bulk = bulk_report_zip if args.output.lower().endswith(".zip") else bulk_report_pdf
+    count, errors = bulk(read_beams(args.input, args.format), args.output, workers=args.workers, title=args.title)
+    for name, error in errors:
+        print(f"{name}: {error}", file=sys.stderr)
+    print(f"Klaar: {count} rapporten in {time.perf_counter() - start:.1f} s, {len(errors)} fouten",
+          file=sys.stderr)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
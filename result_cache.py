@@ -0,0 +1,121 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+def _normalize(value):
+    """Maak een waarde vergelijkbaar: getallen als float, tekst in kleine letters"""
+    if isinstance(value, str):
+        return value.strip().lower()
+    if value is None:
+        return None
+    value = float(value)
+    return 0.0 if value == 0 else value  # -0.0 en 0.0 gelijk
+
+def canonical_model(beam_length, supports, loads, **params):
+    """Canonieke vorm van een liggermodel (volgorde van invoer telt niet)"""
+    return {
+        'L': _normalize(beam_length),
+        'supports': sorted([_normalize(p), _normalize(t)] for p, t in supports),
+        'loads': sorted([_normalize(v) for v in load] for load in loads),
+        'params': {k: _normalize(v) for k, v in params.items()},
+    }
+
+def model_hash(beam_length, supports, loads, **params):
+    """Inhoudsadres van een liggermodel, profiel en materiaal (sha256, hex)"""
+    model = canonical_model(beam_length, supports, loads, **params)
+    text = json.dumps(model, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def result_nbytes(value):
+    """Geheugengebruik van de arrays in een resultaat (tuple, dict, array of object met nbytes)"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(result_nbytes(v) for v in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(result_nbytes(v) for v in value)
+    return getattr(value, 'nbytes', 0)  # objecten met eigen nbytes (InfluenceLines)
+
+def _freeze(value):
+    """Maak arrays alleen-lezen zodat gedeelde cache-resultaten niet wijzigen"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze(v)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _freeze(v)
+    return value
+
+class ResultCache:
+    """LRU-cache voor rekenresultaten met limiet op aantal en op geheugen"""
+
+    def __init__(self, maxsize=128, max_bytes=64 * 1024**2):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key][0]
+
+    def put(self, key, value):
+        size = result_nbytes(value)
+        if size > self.max_bytes:
+            return value  # Te groot om te bewaren
+        _freeze(value)
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data.pop(key)[1]
+            self._data[key] = (value, size)
+            self.nbytes += size
+            # Verwijder minst recent gebruikte resultaten
+            while len(self._data) > self.maxsize or self.nbytes > self.max_bytes:
+                _, (_, old_size) = self._data.popitem(last=False)
+                self.nbytes -= old_size
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+# Gedeelde cache voor app en batchscripts binnen één proces
+analysis_cache = ResultCache()
+
+def cached_solve(beam_length, supports, loads, EI, n_points=200, cache=None, store=None):
+    """BeamSolver(...).solve() met resultaat uit de cache bij ongewijzigd model
+
+    De sleutel komt uit het canonieke model plus n_points (het adaptieve
+    rooster volgt daar eenduidig uit), zodat een cache-treffer geen rooster
+    of reacties hoeft te berekenen. Alleen bij een misser wordt de solver
+    gebouwd; met een ResultStore wordt dan eerst op schijf gezocht.
+    """
+    from beam_solver import BeamSolver
+
+    cache = analysis_cache if cache is None else cache
+    key = model_hash(beam_length, supports, loads, EI=EI, n_points=int(n_points))
+    results = cache.get(key)
+    if results is None:
+        solver = BeamSolver(beam_length, supports, loads, EI, n_points=n_points)
+        results = cache.put(key, solver.solve(store=store))
+    return results
@@ -0,0 +1,133 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+
+import numpy as np
+
+ARRAY_KEYS = ('x', 'V', 'M', 'theta', 'y')
+
+# Versie van de opgeslagen resultaten. Ophogen bij elke wijziging die
+# uitkomsten verandert (solver, profielformules, opslagformaat): een store
+# met een andere versie wordt bij het openen geleegd.
+RESULT_VERSION = 4
+
+# last_access wordt bij lezen hooguit eens per zoveel seconden bijgewerkt,
+# zodat een cache-treffer normaal geen schrijftransactie is
+ACCESS_RESOLUTION = 300.0
+
+def _encode_reactions(reactions):
+    """Reacties als JSON; sleuteltype (positie of "M_...") blijft behouden"""
+    return json.dumps([[k if isinstance(k, str) else float(k), float(v)] for k, v in reactions.items()])
+
+def _decode_reactions(text):
+    return {k: v for k, v in json.loads(text)}
+
+class ResultStore:
+    """Persistente resultaatopslag in SQLite, geadresseerd op modelhash
+
+    Arrays worden als ruwe float64-bytes opgeslagen, reacties als JSON.
+    Bij overschrijden van max_entries of max_bytes worden de langst niet
+    gebruikte resultaten verwijderd (last_access, met een resolutie van
+    ACCESS_RESOLUTION). Elke bewerking opent en sluit een eigen
+    verbinding, zodat meerdere processen dezelfde store kunnen delen.
+    """
+
+    def __init__(self, path, max_entries=10000, max_bytes=512 * 1024**2):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, n INTEGER, data BLOB, reactions TEXT, "
+                "nbytes INTEGER, last_access REAL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_access ON results (last_access)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            row = db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != str(RESULT_VERSION):
+                # Resultaten van een andere solverversie zijn niet meer geldig
+                db.execute("DELETE FROM results")
+                db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(RESULT_VERSION),))
+
+    @contextmanager
+    def _connect(self):
+        """Verbinding als transactie (commit of rollback) die daarna wordt gesloten"""
+        with closing(sqlite3.connect(self.path, timeout=30)) as db:
+            with db:
+                yield db
+
+    def __contains__(self, key):
+        with self._connect() as db:
+            return db.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        """Resultaat-dict (x, V, M, theta, y, reactions) of None"""
+        with self._connect() as db:
+            row = db.execute("SELECT n, data, reactions, last_access FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[3] > ACCESS_RESOLUTION:
+                db.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+        n, data, reactions, _ = row
+        arrays = np.frombuffer(data, dtype=np.float64).reshape(len(ARRAY_KEYS), n)
+        results = dict(zip(ARRAY_KEYS, arrays))
+        results['reactions'] = _decode_reactions(reactions)
+        return results
+
+    def put(self, key, results):
+        """Sla een resultaat-dict op en pas daarna de eviction toe"""
+        arrays = np.array([np.asarray(results[k], dtype=np.float64) for k in ARRAY_KEYS])
+        data = arrays.tobytes()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, arrays.shape[1], data, _encode_reactions(results['reactions']),
+                 len(data), time.time())
+            )
+            self._evict(db)
+        return results
+
+    def _evict(self, db):
+        count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM results").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # Verwijder oudste eerst tot beide limieten weer gehaald worden
+        rows = db.execute("SELECT key, nbytes FROM results ORDER BY last_access").fetchall()
+        remove = []
+        for key, nbytes in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            remove.append((key,))
+            count -= 1
+            total -= nbytes
+        db.executemany("DELETE FROM results WHERE key = ?", remove)
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+_default_store = None
+
+def default_store():
+    """Gedeelde store op het pad uit BEAM_RESULT_STORE, anders None
+
+    De persistente store is opt-in: zonder de variabele wordt niets op
+    schijf gedeeld (geen gemeenschappelijk bestand in de tempmap voor
+    alle gebruikers en processen).
+    """
+    global _default_store
+    path = os.environ.get("BEAM_RESULT_STORE")
+    if not path:
+        return None
+    if _default_store is None or _default_store.path != path:
+        _default_store = ResultStore(path)
+    return _default_store
@@ -0,0 +1,22 @@
+"""Bandsolver van de drie-momentenvergelijking tegen een volle oplossing"""
+import numpy as np
+import pytest
+
+from beam_solver import custom_solve_banded
+
+@pytest.mark.parametrize("l, u", [(1, 1), (2, 1), (1, 2), (2, 2), (3, 1), (0, 2)])
+def test_banded_solver_matches_dense(l, u):
+    rng = np.random.default_rng(l * 10 + u)
+    n = 12
+    A = np.zeros((n, n))
+    for i in range(n):
+        for j in range(max(0, i - l), min(n, i + u + 1)):
+            A[i, j] = rng.uniform(-1, 1)
+        A[i, i] = 2 * (l + u) + 1  # diagonaal dominant
+    # Bandopslag van de module: ab[l + j - i, i] = A[i, j]
+    ab = np.zeros((l + u + 1, n))
+    for i in range(n):
+        for j in range(max(0, i - l), min(n, i + u + 1)):
+            ab[l + j - i, i] = A[i, j]
+    b = rng.uniform(-1, 1, n)
+    np.testing.assert_allclose(custom_solve_banded((l, u), ab, b), np.linalg.solve(A, b))
@@ -0,0 +1,45 @@
+"""Batchinvoer: stapsgewijs JSON lezen, CSV-notatie en fouten per ligger"""
+import csv
+import io
+import json
+
+import pytest
+
+from beam_batch import _beam_from_csv, _iter_json, run_batch, solve_beam, solve_beam_safe
+
+BEAM = {"id": "L1", "length": 6000, "supports": [[0, "Scharnier"], [6000, "Rol"]],
+        "loads": [[0, 10, "Verdeelde last", 6000], [2000, 5000, "Puntlast"]], "EI": 2e12}
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_json_array_split_across_chunks(chunk_size):
+    items = [BEAM, {**BEAM, "id": "L2"}, 12345, "tekst", None]
+    text = " [\n" + ",\n  ".join(json.dumps(item) for item in items) + "\n] "
+    assert list(_iter_json(io.StringIO(text), chunk_size=chunk_size)) == items
+
+def test_json_single_object():
+    assert list(_iter_json(io.StringIO(json.dumps(BEAM)), chunk_size=5)) == [BEAM]
+
+def test_json_empty_array():
+    assert list(_iter_json(io.StringIO(" [ ] "))) == []
+
+def test_csv_row_with_trapezoid_load():
+    text = ("id,length,supports,loads,EI\n"
+            "T1,6000,0:Scharnier;6000:Rol,1000:2:Trapeziumlast:4000:6;3000:5000:Puntlast,2e12\n")
+    beam = _beam_from_csv(next(csv.DictReader(io.StringIO(text))))
+    assert beam['supports'] == [[0.0, "Scharnier"], [6000.0, "Rol"]]
+    assert beam['loads'] == [[1000.0, 2.0, "Trapeziumlast", 4000.0, 6.0], [3000.0, 5000.0, "Puntlast"]]
+    assert beam['length'] == 6000.0 and beam['EI'] == 2e12
+    # Resultante van de trapeziumlast (2 -> 6 N/mm over 4 m) plus de puntlast
+    reactions = solve_beam(beam)['reactions']
+    assert sum(reactions.values()) == pytest.approx(4000 * (2 + 6) / 2 + 5000)
+
+@pytest.mark.parametrize("entry", [12345, "tekst", None, [1, 2], {"id": "x"}])
+def test_non_object_entry_gives_error_row(entry):
+    result = solve_beam_safe(entry)
+    assert 'error' in result
+
+def test_batch_continues_after_bad_entry():
+    results = []
+    count, failed, _ = run_batch([BEAM, 5, "tekst", BEAM], results.append, log=io.StringIO())
+    assert (count, failed) == (4, 2)
+    assert [r.get('id') for r in results] == ["L1", None, None, "L1"]
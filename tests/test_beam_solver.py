@@ -0,0 +1,86 @@
+"""Controles van de rekenkern tegen gesloten oplossingen"""
+import numpy as np
+import pytest
+
+from beam_solver import BeamSolver, support_reactions
+from extrema import beam_extremes
+
+q = 2.0          # N/mm
+L = 6000.0       # mm
+P = 10000.0      # N
+EI = 2.1e5 * 2e7  # N·mm²
+
+def test_simply_supported_udl():
+    solver = BeamSolver(L, [(0, "Scharnier"), (L, "Rol")], [(0, q, "Verdeelde last", L)], EI)
+    extremes = beam_extremes(solver.solve_piecewise())
+    reactions = solver.reactions
+    assert reactions[0] == pytest.approx(q*L/2)
+    assert reactions[L] == pytest.approx(q*L/2)
+    assert extremes['M'][0] == pytest.approx(q*L**2/8)
+    assert extremes['M'][1] == pytest.approx(L/2)
+    assert extremes['y'][0] == pytest.approx(-5*q*L**4/(384*EI))
+
+def test_simply_supported_udl_on_grid():
+    results = BeamSolver(L, [(0, "Scharnier"), (L, "Rol")], [(0, q, "Verdeelde last", L)], EI).solve()
+    assert results['M'].max() == pytest.approx(q*L**2/8, rel=1e-3)
+    assert results['y'].min() == pytest.approx(-5*q*L**4/(384*EI), rel=1e-3)
+
+def test_propped_cantilever_udl():
+    reactions = support_reactions([(0, "Inklemming"), (L, "Rol")], [(0, q, "Verdeelde last", L)])
+    assert reactions[L] == pytest.approx(3*q*L/8)
+    assert reactions[0] == pytest.approx(5*q*L/8)
+    assert reactions["M_0"] == pytest.approx(-q*L**2/8)
+
+def test_two_equal_spans_udl():
+    supports = [(0, "Scharnier"), (L, "Rol"), (2*L, "Rol")]
+    loads = [(0, q, "Verdeelde last", 2*L)]
+    reactions = support_reactions(supports, loads)
+    assert reactions[L] == pytest.approx(10*q*L/8)
+    assert reactions[0] == pytest.approx(3*q*L/8)
+    M = BeamSolver(2*L, supports, loads, EI).solve_piecewise()['M']
+    assert M(L) == pytest.approx(-q*L**2/8)
+
+def test_fixed_fixed_midspan_point_load():
+    solver = BeamSolver(L, [(0, "Inklemming"), (L, "Inklemming")], [(L/2, P, "Puntlast")], EI)
+    results = solver.solve_piecewise()
+    assert results['M'](L/2) == pytest.approx(P*L/8)
+    assert results['M'](0.0) == pytest.approx(-P*L/8)
+    assert solver.reactions[0] == pytest.approx(P/2)
+    assert results['y'](L/2) == pytest.approx(-P*L**3/(192*EI))
+
+def test_overhang_reactions():
+    reactions = support_reactions([(0, "Scharnier"), (4000, "Rol")], [(6000, P, "Puntlast")])
+    assert reactions[4000] == pytest.approx(1.5*P)
+    assert reactions[0] == pytest.approx(-0.5*P)
+
+def test_cantilever_tip_load():
+    results = BeamSolver(L, [(0, "Inklemming")], [(L, P, "Puntlast")], EI).solve_piecewise()
+    assert results['reactions'][0] == pytest.approx(P)
+    assert results['M'](0.0) == pytest.approx(-P*L)
+    assert results['y'](L) == pytest.approx(-P*L**3/(3*EI))
+
+def test_cached_solve_hit_skips_solver(monkeypatch):
+    import beam_solver
+    from result_cache import ResultCache, cached_solve
+
+    cache = ResultCache()
+    args = (L, [(0, "Scharnier"), (L, "Rol")], [(0, q, "Verdeelde last", L)], EI)
+    first = cached_solve(*args, cache=cache)
+    monkeypatch.setattr(beam_solver, "BeamSolver", None)  # een treffer mag geen solver bouwen
+    assert cached_solve(*args, cache=cache) is first
+
+@pytest.mark.parametrize("n_spans", [3, 10, 50])
+def test_continuous_beam_grid_matches_exact(n_spans):
+    # Ook bij veel velden genoeg knopen per veld: y = 0 op elk steunpunt
+    length = n_spans * L
+    supports = [(0, "Scharnier")] + [(i * L, "Rol") for i in range(1, n_spans + 1)]
+    solver = BeamSolver(length, supports, [(0, q, "Verdeelde last", length)], EI)
+    results = solver.solve()
+    exact = solver.solve_piecewise()
+    x, y = results['x'], results['y']
+    y_max = np.abs(exact['y'](x)).max()
+    on_support = np.isin(x, [pos for pos, _ in supports])
+    assert on_support.sum() == n_spans + 1
+    assert np.abs(y[on_support]).max() < 1e-6 * y_max
+    np.testing.assert_allclose(y, exact['y'](x), atol=1e-6 * y_max)
+    assert np.abs(y).max() == pytest.approx(y_max, rel=1e-6)
@@ -0,0 +1,31 @@
+"""Invloedslijnen tegen een directe oplossing en de geheugengrens van de cache"""
+import numpy as np
+import pytest
+
+from beam_solver import BeamSolver
+from errors import LoadError
+from influence_lines import InfluenceLines, influence_cache, influence_lines
+
+SUPPORTS = [(0, "Scharnier"), (4000, "Rol"), (9000, "Rol")]
+EI = 4.2e12
+
+def test_nodal_loads_match_direct_solve():
+    il = influence_lines(9000, SUPPORTS, EI)
+    loads = [(il.x[40], 20000.0, "Puntlast"), (il.x[120], 3e6, "Moment")]
+    direct = BeamSolver(9000, SUPPORTS, loads, EI, x=il.x).solve()
+    result = il.evaluate(loads)
+    for key in ('V', 'M', 'y'):
+        np.testing.assert_allclose(result[key], direct[key], atol=1e-6 * np.abs(direct[key]).max())
+
+def test_point_rows_only():
+    il = influence_lines(9000, SUPPORTS, EI, moments=False)
+    assert il.M.shape == (il.n_nodes, il.n_nodes)
+    with pytest.raises(LoadError):
+        il.load_vector([(1000, 1.0, "Moment")])
+
+def test_cache_respects_byte_limit(monkeypatch):
+    monkeypatch.setattr(influence_cache, "max_bytes", 1)
+    before = len(influence_cache)
+    il = influence_lines(8000, SUPPORTS[:2], EI, x=np.linspace(0, 8000, 11))
+    assert isinstance(il, InfluenceLines)
+    assert len(influence_cache) == before  # te groot: wel berekend, niet bewaard
@@ -0,0 +1,32 @@
+"""Cumulatieve integratie: exact voor polynomen van de bijbehorende graad"""
+import numpy as np
+import pytest
+
+from beam_solver import cumulative_integrate
+
+# Niet-uniform rooster met een dubbele knoop
+X = np.array([0.0, 0.3, 1.0, 1.1, 1.1, 2.0, 2.6, 4.0])
+
+def test_trapezoid_exact_for_linear():
+    np.testing.assert_allclose(cumulative_integrate(2*X + 1, X), X**2 + X)
+
+@pytest.mark.parametrize("x", [X, np.unique(X)])
+def test_simpson_exact_for_quadratic(x):
+    y = 3*x**2 - 2*x + 1
+    np.testing.assert_allclose(cumulative_integrate(y, x, method="simpson"), x**3 - x**2 + x, atol=1e-12)
+
+@pytest.mark.parametrize("x", [X, np.unique(X)])
+def test_exact_for_cubic_with_derivative(x):
+    y = x**3 - 4*x**2 + x - 2
+    dydx = 3*x**2 - 8*x + 1
+    F = x**4/4 - 4*x**3/3 + x**2/2 - 2*x
+    np.testing.assert_allclose(cumulative_integrate(y, x, method="exact", dydx=dydx), F, atol=1e-12)
+
+def test_exact_along_axis_and_initial():
+    y = np.stack([X**3, 2*X**3])
+    result = cumulative_integrate(y.T, X, initial=1.0, method="exact", dydx=np.stack([3*X**2, 6*X**2]).T, axis=0)
+    np.testing.assert_allclose(result.T, np.stack([X**4/4, X**4/2]) + 1.0, atol=1e-12)
+
+def test_exact_requires_derivative():
+    with pytest.raises(ValueError):
+        cumulative_integrate(X, X, method="exact")
@@ -0,0 +1,33 @@
+"""Belastingcombinaties: gunstig werkende permanente lasten"""
+import pytest
+
+from beam_solver import support_reactions
+from load_combinations import combine_load_cases, standard_combinations
+
+def test_favourable_permanent_variants():
+    rules = dict(standard_combinations({"G": "permanent", "Q": "variabel"}))
+    assert rules["ULS: Q hoofdlast"] == {"G": 1.35, "Q": 1.5}
+    assert rules["ULS: Q hoofdlast (G gunstig)"] == {"G": 1.0, "Q": 1.5}
+    assert len(standard_combinations({"G": "permanent", "Q": "variabel"}, "SLS")) == 2
+
+def test_uplift_governed_by_favourable_permanent():
+    # Last op de uitkraging trekt het eerste steunpunt omhoog; eigengewicht werkt gunstig
+    supports = [(0, "Scharnier"), (4000, "Rol")]
+    cases = {"G": [(0, 2.0, "Verdeelde last", 4000)], "Q": [(6000, 10000, "Puntlast")]}
+    categories = {"G": "permanent", "Q": "variabel"}
+    combined = combine_load_cases(6000, supports, 2e12, cases, standard_combinations(categories))
+    R_G = support_reactions(supports, cases["G"])[0]
+    R_Q = support_reactions(supports, cases["Q"])[0]
+    assert combined['envelope']['reactions'][0]['min'].min() == pytest.approx(1.0 * R_G + 1.5 * R_Q)
+
+def test_opposing_wind_is_omitted_when_favourable():
+    # G = 1, Q = 2, W = -1 N/mm op een vrij opgelegde ligger van 6 m
+    span = 6000.0
+    supports = [(0, "Scharnier"), (span, "Rol")]
+    cases = {name: [(0, q, "Verdeelde last", span)] for name, q in (("G", 1.0), ("Q", 2.0), ("W", -1.0))}
+    categories = {"G": "permanent", "Q": "variabel", "W": "wind"}
+    rules = dict(standard_combinations(categories))
+    assert rules["ULS: Q hoofdlast (zonder W)"] == {"G": 1.35, "Q": 1.5}
+    combined = combine_load_cases(span, supports, 2e12, cases, standard_combinations(categories))
+    expected = (1.35*1.0 + 1.5*2.0) * span**2 / 8
+    assert combined['envelope']['M']['max'].max() == pytest.approx(expected, rel=1e-4)
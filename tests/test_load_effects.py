@@ -0,0 +1,19 @@
+"""V en M van losse lasten (gesorteerde sprongen en cumulatieve sommen)"""
+import numpy as np
+
+from beam_solver import _load_effects
+
+q = 2.0          # N/mm
+L = 6000.0       # mm
+P = 10000.0      # N
+
+def test_load_effects_closed_form():
+    # Driehoekslast 0 -> q over [a, a + c]: V = -q d²/2c, M = -q d³/6c binnen de last
+    a, c = 1000.0, 3000.0
+    x = np.linspace(0, L, 241)
+    V, M = _load_effects(x, [(a, q, "Driehoekslast", c), (2000, P, "Puntlast"), (5000, 2e6, "Moment")])
+    d = np.clip(x - a, 0, c)
+    F = q*d**2/(2*c)
+    arm = np.where(x > a + c, x - a - 2*c/3, d/3)
+    np.testing.assert_allclose(V, -F - P*(x >= 2000), atol=1e-9)
+    np.testing.assert_allclose(M, -F*arm - P*np.clip(x - 2000, 0, None) + 2e6*(x >= 5000), atol=1e-6)
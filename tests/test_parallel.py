@@ -0,0 +1,78 @@
+"""Parallel rekenen: zelfde uitvoer als serieel, geen gelekt gedeeld geheugen"""
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import parallel
+from beam_batch import ARRAY_KEYS, solve_beam_safe
+from beam_solver import BeamSolver
+
+def _beams(n):
+    for i in range(n):
+        length = 4000.0 + 250 * i
+        supports = [[0, "Scharnier"], [length / 2, "Rol"], [length, "Rol"]] if i % 2 else [[0, "Inklemming"]]
+        loads = [[0, 5 + i, "Verdeelde last", length], [length / 3, 1000 * i, "Puntlast"]]
+        if i == 3:
+            loads = [[0, 1, "Onbekend"]]
+        yield {"id": f"L{i}", "length": length, "supports": supports, "loads": loads, "EI": 2e12,
+               "n_points": 50 + 10 * i}
+
+def _assert_same(parallel_results, serial_results):
+    assert len(parallel_results) == len(serial_results)
+    for got, expected in zip(parallel_results, serial_results):
+        assert got.keys() == expected.keys()
+        for key, value in expected.items():
+            if key in ARRAY_KEYS:
+                np.testing.assert_array_equal(got[key], value)
+            else:
+                assert got[key] == value
+
+def test_solve_beams_parallel_matches_serial():
+    serial = [solve_beam_safe(beam, arrays=True) for beam in _beams(12)]
+    assert 'error' in serial[3]
+    _assert_same(list(parallel.solve_beams_parallel(_beams(12), workers=2, chunk_size=5, arrays=True)), serial)
+
+def test_grid_larger_than_bound_falls_back_to_pickling(monkeypatch):
+    # De grens wordt in het hoofdproces bepaald; te klein -> arrays via pickle
+    monkeypatch.setattr(parallel, "_array_bound", lambda beam: 3)
+    serial = [solve_beam_safe(beam, arrays=True) for beam in _beams(4)]
+    _assert_same(list(parallel.solve_beams_parallel(_beams(4), workers=2, chunk_size=2, arrays=True)), serial)
+
+def test_array_bound_covers_adaptive_grid():
+    for beam in _beams(12):
+        if beam['id'] == "L3":
+            continue
+        result = solve_beam_safe(beam, arrays=True)
+        assert len(result['x']) <= parallel._array_bound(beam)
+
+def test_solve_load_cases_parallel_matches_solve_batch():
+    supports = [(0, "Scharnier"), (2500, "Rol"), (6000, "Inklemming")]
+    cases = [[(500 * (i + 1), 1000.0 * (i + 1), "Puntlast"), (0, 1.0 + i, "Verdeelde last", 6000)] for i in range(10)]
+    x = np.linspace(0, 6000, 121)
+    expected = BeamSolver(6000, supports, [], 2e12, x=x).solve_batch(cases)
+    got = parallel.solve_load_cases_parallel(6000, supports, 2e12, cases, x=x, workers=2, chunk_size=3)
+    for key in ('V', 'M', 'theta', 'y'):
+        np.testing.assert_allclose(got[key], expected[key], rtol=1e-12, atol=1e-12 * np.abs(expected[key]).max())
+    for key, value in expected['reactions'].items():
+        np.testing.assert_allclose(got['reactions'][key], value)
+
+def test_early_stop_releases_shared_memory(monkeypatch):
+    created = []
+    original = shared_memory.SharedMemory
+
+    def tracking(*args, **kwargs):
+        shm = original(*args, **kwargs)
+        if kwargs.get('create'):
+            created.append(shm.name)
+        return shm
+
+    monkeypatch.setattr(parallel.shared_memory, "SharedMemory", tracking)
+    results = parallel.solve_beams_parallel(_beams(40), workers=2, chunk_size=2, arrays=True)
+    next(results)
+    results.close()
+
+    assert len(created) > 1
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            original(name=name)
@@ -0,0 +1,18 @@
+"""Doorsnede-eigenschappen tegen handberekeningen"""
+import pytest
+
+from profiles import moment_of_inertia, section_area
+
+def test_i_section_moment_of_inertia():
+    # HEA 200: h=190, b=200, tw=6.5, tf=10 (zonder afrondingsstralen)
+    h, b, t_w, t_f = 190.0, 200.0, 6.5, 10.0
+    h_w = h - 2*t_f
+    expected = t_w*h_w**3/12 + 2*(b*t_f**3/12 + b*t_f*((h - t_f)/2)**2)
+    assert moment_of_inertia("I-profiel", h, b, t_w, t_f) == pytest.approx(expected)
+    assert expected == pytest.approx(3.50945e7, rel=1e-5)
+    assert section_area("I-profiel", h, b, t_w, t_f) == pytest.approx(2*b*t_f + t_w*h_w)
+
+def test_box_section_moment_of_inertia():
+    h, b, t = 100.0, 50.0, 5.0
+    expected = (b*h**3 - (b - 2*t)*(h - 2*t)**3)/12
+    assert moment_of_inertia("Koker", h, b, t) == pytest.approx(expected)
@@ -0,0 +1,45 @@
+"""Persistente resultaatopslag: versiecontrole en leesgedrag"""
+import sqlite3
+
+import numpy as np
+
+import result_store
+from result_store import ResultStore
+
+def _results(n=5):
+    x = np.linspace(0, 1, n)
+    return {'x': x, 'V': x + 1, 'M': x + 2, 'theta': x + 3, 'y': x + 4,
+            'reactions': {0.0: 1.5, 'M_0.0': -2.0}}
+
+def test_round_trip(tmp_path):
+    store = ResultStore(str(tmp_path / "r.sqlite"))
+    store.put("a", _results())
+    got = store.get("a")
+    for k in result_store.ARRAY_KEYS:
+        np.testing.assert_array_equal(got[k], _results()[k])
+    assert got['reactions'] == {0.0: 1.5, 'M_0.0': -2.0}
+    assert store.get("b") is None
+
+def test_other_version_is_wiped(tmp_path, monkeypatch):
+    path = str(tmp_path / "r.sqlite")
+    ResultStore(path).put("a", _results())
+    assert len(ResultStore(path)) == 1
+    monkeypatch.setattr(result_store, "RESULT_VERSION", result_store.RESULT_VERSION + 1)
+    assert len(ResultStore(path)) == 0
+
+def test_hit_does_not_write(tmp_path):
+    path = str(tmp_path / "r.sqlite")
+    store = ResultStore(path)
+    store.put("a", _results())
+    with sqlite3.connect(path) as db:
+        before = db.execute("SELECT last_access FROM results").fetchone()[0]
+    store.get("a")
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT last_access FROM results").fetchone()[0] == before
+
+def test_default_store_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("BEAM_RESULT_STORE", raising=False)
+    assert result_store.default_store() is None
+    monkeypatch.setattr(result_store, "_default_store", None)
+    monkeypatch.setenv("BEAM_RESULT_STORE", str(tmp_path / "r.sqlite"))
+    assert result_store.default_store().path == str(tmp_path / "r.sqlite")
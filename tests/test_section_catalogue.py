@@ -0,0 +1,19 @@
+"""Profielcatalogus: één bron van waarheid met de scalaire formules"""
+import numpy as np
+import pytest
+
+from profiles import PROFILE_TABLES, PROFILE_TYPES, get_profile_dimensions, moment_of_inertia, section_area, section_catalogue
+
+def test_catalogue_matches_scalar_formulas():
+    catalogue = section_catalogue()
+    i = catalogue.index("HEA 200")
+    assert catalogue.I[i] == pytest.approx(moment_of_inertia("I-profiel", catalogue.h[i], catalogue.b[i],
+                                                              catalogue.t_w[i], catalogue.t_f[i]))
+    assert np.all(np.diff(catalogue.mass[catalogue.query(I_min=catalogue.I[i])]) >= 0)
+
+def test_catalogue_covers_every_table_row():
+    catalogue = section_catalogue()
+    assert len(catalogue) == sum(len(table) for table in PROFILE_TABLES.values())
+    for i, (category, name) in enumerate(zip(catalogue.category, catalogue.name)):
+        dims = get_profile_dimensions(str(category), str(name))
+        assert catalogue.A[i] == section_area(PROFILE_TYPES[str(category)], *dims)
@@ -0,0 +1,26 @@
+"""solve_batch: veel belastinggevallen op één ligger via superpositie"""
+import numpy as np
+import pytest
+
+from beam_solver import BeamSolver
+
+q = 2.0          # N/mm
+L = 6000.0       # mm
+P = 10000.0      # N
+EI = 2.1e5 * 2e7  # N·mm²
+
+def test_solve_batch_equals_repeated_solve():
+    supports = [(0, "Scharnier"), (2500, "Rol"), (L, "Inklemming")]
+    cases = [
+        [(1000, P, "Puntlast")],
+        [(0, q, "Verdeelde last", L), (3000, 2e6, "Moment")],
+        [(500, 1.0, "Trapeziumlast", 4000, 3.0), (4500, -P, "Puntlast")],
+    ]
+    x = np.linspace(0, L, 301)
+    batch = BeamSolver(L, supports, [], EI, x=x).solve_batch(cases)
+    for i, loads in enumerate(cases):
+        single = BeamSolver(L, supports, loads, EI, x=x).solve()
+        for key in ('V', 'M', 'theta', 'y'):
+            np.testing.assert_allclose(batch[key][i], single[key], rtol=1e-9, atol=1e-9 * np.abs(single[key]).max())
+        for key, value in single['reactions'].items():
+            assert batch['reactions'][key][i] == pytest.approx(value)